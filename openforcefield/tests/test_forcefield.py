@@ -2407,6 +2407,45 @@ class TestForceFieldChargeAssignment:
             charge, _, _ = nonbonded_force.getParticleParameters(idx)
             assert abs(charge - expected_charge) < 1.0e-6 * unit.elementary_charge
 
+    def test_charge_increment_model_repeated_create_openmm_system(self):
+        """Test that parametrizing the same Topology twice assigns the same charge increments"""
+        test_charge_increment_model_ff = """
+        <SMIRNOFF version="0.3" aromaticity_model="OEAroModel_MDL">
+          <Electrostatics version="0.3" method="PME" scale12="0.0" scale13="0.0" scale14="0.833333" cutoff="9.0 * angstrom"/>
+          <ChargeIncrementModel version="0.3" number_of_conformers="1" partial_charge_method="formal_charge">
+            <ChargeIncrement smirks="[#6X4:1]-[#8:2]" charge_increment1="-0.05*elementary_charge" charge_increment2="0.05*elementary_charge"/>
+          </ChargeIncrementModel>
+        </SMIRNOFF>"""
+        file_path = get_data_file_path("test_forcefields/smirnoff99Frosst.offxml")
+        ff = ForceField(file_path, test_charge_increment_model_ff)
+        del ff._parameter_handlers["ToolkitAM1BCC"]
+        top = Topology.from_molecules([create_ethanol(), create_reversed_ethanol()])
+
+        # create_openmm_system works on a copy of the topology, so nothing carries
+        # over from the first call to the second.
+        all_charges = []
+        for _ in range(2):
+            sys = ff.create_openmm_system(top)
+            nonbonded_force = [
+                force
+                for force in sys.getForces()
+                if isinstance(force, openmm.NonbondedForce)
+            ][0]
+            all_charges.append(
+                [
+                    nonbonded_force.getParticleParameters(idx)[0]
+                    for idx in range(nonbonded_force.getNumParticles())
+                ]
+            )
+
+        assert all_charges[0] == all_charges[1]
+        assert abs(all_charges[0][1] - (-0.05 * unit.elementary_charge)) < (
+            1.0e-6 * unit.elementary_charge
+        )
+        assert abs(all_charges[0][16] - (-0.05 * unit.elementary_charge)) < (
+            1.0e-6 * unit.elementary_charge
+        )
+
     def test_charge_increment_model_one_less_ci_than_tagged_atom(self):
         """
         Ensure that we support the behavior where a ChargeIncrement is initialized with one less chargeincrement value
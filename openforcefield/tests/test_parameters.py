@@ -35,12 +35,18 @@ from openforcefield.typing.engines.smirnoff.parameters import (
     ParameterType,
     ProperTorsionHandler,
     SMIRNOFFSpecError,
+    ToolkitAM1BCCHandler,
     VirtualSiteHandler,
+    _allow_only,
+    _compute_partial_charges,
     _linear_inter_or_extrapolate,
+    _molecule_invariants,
     _ParameterAttributeHandler,
+    _stringent_isomorphism_atom_map,
 )
 from openforcefield.utils import IncompatibleUnitError, detach_units
 from openforcefield.utils.collections import ValidatedList
+from openforcefield.utils.toolkits import BuiltInToolkitWrapper
 
 # ======================================================================
 # Test ParameterAttribute descriptor
@@ -179,6 +185,34 @@ class TestParameterAttribute:
 
         assert isinstance(MyParameter.attr, ParameterAttribute)
 
+    def test_allow_only_converter(self):
+        """_allow_only compares raw values, and only reads the string "None" as None."""
+
+        class MyParameter:
+            attr_none = ParameterAttribute(
+                default="ACE", converter=_allow_only(["ACE", None])
+            )
+            attr_string = ParameterAttribute(
+                default="None", converter=_allow_only(["None"])
+            )
+
+        my_par = MyParameter()
+
+        # The string "None" is converted to None when None is allowed.
+        my_par.attr_none = "None"
+        assert my_par.attr_none is None
+        my_par.attr_none = None
+        assert my_par.attr_none is None
+        my_par.attr_none = "ACE"
+        assert my_par.attr_none == "ACE"
+        with pytest.raises(SMIRNOFFSpecError, match="only the following values"):
+            my_par.attr_none = "HCT"
+
+        # An allowed string "None" does not make None (or "None") acceptable.
+        for value in [None, "None"]:
+            with pytest.raises(SMIRNOFFSpecError):
+                my_par.attr_string = value
+
 
 class TestIndexedParameterAttribute:
     """Tests for the IndexedParameterAttribute descriptor."""
@@ -328,6 +362,60 @@ class TestInterpolation:
         assert k / k.unit < 0
 
 
+class TestStringentIsomorphismAtomMap:
+    """Test the memoized atom mapping used to match user-provided molecules."""
+
+    def test_atom_map_reordered_molecule(self):
+        """The atom map of a reordered molecule is found, and reused for copies of it."""
+        from openforcefield.tests.test_forcefield import (
+            create_ethanol,
+            create_reversed_ethanol,
+        )
+        from openforcefield.typing.engines.smirnoff import parameters
+
+        ethanol = create_ethanol()
+        reversed_ethanol = create_reversed_ethanol()
+
+        atom_map = _stringent_isomorphism_atom_map(ethanol, reversed_ethanol)
+        assert sorted(atom_map.values()) == list(range(ethanol.n_atoms))
+        for atom_idx, atom in enumerate(ethanol.atoms):
+            mapped_atom = reversed_ethanol.atoms[atom_map[atom_idx]]
+            assert atom.atomic_number == mapped_atom.atomic_number
+
+        key = (ethanol.to_smiles(mapped=True), reversed_ethanol.to_smiles(mapped=True))
+        assert parameters._STRINGENT_ATOM_MAPS[key] == atom_map
+        assert (
+            _stringent_isomorphism_atom_map(create_ethanol(), create_reversed_ethanol())
+            == atom_map
+        )
+
+    def test_atom_map_different_molecules(self):
+        """Molecules with the same graph but different formal charges are not mapped."""
+        from openforcefield.topology import Molecule
+
+        assert (
+            _stringent_isomorphism_atom_map(
+                Molecule.from_smiles("C[NH3+]"), Molecule.from_smiles("CN")
+            )
+            is None
+        )
+
+    def test_molecule_invariants(self):
+        """Reordered copies of a molecule share invariants, charged variants do not."""
+        from openforcefield.tests.test_forcefield import (
+            create_ethanol,
+            create_reversed_ethanol,
+        )
+        from openforcefield.topology import Molecule
+
+        assert _molecule_invariants(create_ethanol()) == _molecule_invariants(
+            create_reversed_ethanol()
+        )
+        assert _molecule_invariants(Molecule.from_smiles("C[NH3+]")) != (
+            _molecule_invariants(Molecule.from_smiles("CN"))
+        )
+
+
 class TestParameterAttributeHandler:
     """Test suite for the base class _ParameterAttributeHandler."""
 
@@ -772,6 +860,32 @@ class TestParameterHandler:
 
         assert len(params) == 1
 
+    def test_find_matches_follows_changes(self):
+        """Test that matches reflect edits to the parameters and the topology"""
+        from openforcefield.topology import Molecule, Topology
+
+        bh = BondHandler(skip_version_check=True)
+        bh.add_parameter(
+            {"smirks": "[*:1]-[*:2]", "length": self.length, "k": self.k, "id": "b0"}
+        )
+        topology = Topology.from_molecules([Molecule.from_smiles("C=C")])
+
+        matches = bh.find_matches(topology)
+        assert len(matches) == 4
+        # Each call returns a new dictionary
+        assert bh.find_matches(topology) is not matches
+
+        bh.add_parameter(
+            {"smirks": "[*:1]=[*:2]", "length": self.length, "k": self.k, "id": "b1"}
+        )
+        assert len(bh.find_matches(topology)) == 5
+
+        bh.parameters[1].smirks = "[#6:1]#[#6:2]"
+        assert len(bh.find_matches(topology)) == 4
+
+        topology.add_molecule(Molecule.from_smiles("C"))
+        assert len(bh.find_matches(topology)) == 8
+
 
 class TestParameterList:
     """Test capabilities of ParameterList for accessing and manipulating SMIRNOFF parameter definitions."""
@@ -1698,6 +1812,25 @@ class TestProperTorsionHandler:
             potential="k*(1+cos(periodicity*theta-phase))", skip_version_check=True
         )
 
+    def test_partial_bond_orders_from_molecules_duplicates(self):
+        """Test that only isomorphic molecules are flagged as duplicate partial bond order molecules"""
+        from openforcefield.topology import Molecule
+
+        ethanol = Molecule.from_smiles("CCO")
+        reversed_ethanol = Molecule.from_smiles("OCC")
+        with pytest.raises(ValueError, match="are isomorphic"):
+            ProperTorsionHandler.check_partial_bond_orders_from_molecules_duplicates(
+                [ethanol, reversed_ethanol]
+            )
+
+        # Tautomers have different bond orders, and are not duplicates
+        # even if they share a standard InChIKey
+        hydroxypyridine = Molecule.from_smiles("Oc1ccccn1")
+        pyridone = Molecule.from_smiles("O=c1cccc[nH]1")
+        ProperTorsionHandler.check_partial_bond_orders_from_molecules_duplicates(
+            [ethanol, hydroxypyridine, pyridone]
+        )
+
 
 class TestVirtualSiteHandler:
     """
@@ -1950,6 +2083,20 @@ class TestLibraryChargeHandler:
             )
 
 
+class _FormalChargeToolkitWrapper(BuiltInToolkitWrapper):
+    """Assigns formal charges for any charge method. It is defined at module level
+    so that it can be sent to worker processes."""
+
+    def assign_partial_charges(
+        self,
+        molecule,
+        partial_charge_method=None,
+        use_conformers=None,
+        strict_n_conformers=False,
+    ):
+        super().assign_partial_charges(molecule, partial_charge_method="formal_charge")
+
+
 class TestChargeIncrementModelHandler:
     def test_create_charge_increment_model_handler(self):
         """Test creation of ChargeIncrementModelHandlers"""
@@ -2070,6 +2217,210 @@ class TestChargeIncrementModelHandler:
             ],
         )
 
+    def test_find_matches_deduplicated(self):
+        """Test that charge increment matches of the same atoms are deduplicated"""
+        from openforcefield.topology import Molecule, Topology
+
+        handler = ChargeIncrementModelHandler(skip_version_check=True)
+        handler.add_parameter(
+            {
+                "smirks": "[#6:1]-[#1:2]",
+                "charge_increment1": 0.1 * unit.elementary_charge,
+                "charge_increment2": -0.1 * unit.elementary_charge,
+            }
+        )
+        # The same atoms matched in the opposite order override the previous match.
+        handler.add_parameter(
+            {
+                "smirks": "[#1:1]-[#6:2]",
+                "charge_increment1": 0.2 * unit.elementary_charge,
+                "charge_increment2": -0.2 * unit.elementary_charge,
+            }
+        )
+        topology = Topology.from_molecules(
+            [Molecule.from_smiles("C"), Molecule.from_smiles("C")]
+        )
+
+        matches = handler.find_matches(topology)
+        assert len(matches) == 8
+        assert all(
+            match.parameter_type.smirks == "[#1:1]-[#6:2]" for match in matches.values()
+        )
+
+    def test_compute_partial_charges_reuses_conformers(self):
+        """Test that existing conformers are kept unless regeneration is forced"""
+        import numpy as np
+
+        from openforcefield.topology import Molecule
+
+        molecule = Molecule.from_smiles("[NH4+]")
+        toolkit = _FormalChargeToolkitWrapper()
+
+        # Conformers are generated if there are not enough
+        _compute_partial_charges(molecule, "formal_charge", 1, False, toolkit)
+        assert molecule.n_conformers == 1
+
+        # Existing conformers are kept by default
+        placeholder = np.zeros((molecule.n_atoms, 3)) * unit.angstrom
+        molecule._conformers = None
+        molecule.add_conformer(placeholder)
+        _compute_partial_charges(molecule, "formal_charge", 1, False, toolkit)
+        assert molecule.n_conformers == 1
+        assert np.all(molecule.conformers[0].value_in_unit(unit.angstrom) == 0.0)
+
+        # and replaced if regeneration is forced
+        _compute_partial_charges(molecule, "formal_charge", 1, True, toolkit)
+        assert molecule.n_conformers == 1
+        assert not np.all(molecule.conformers[0].value_in_unit(unit.angstrom) == 0.0)
+        assert molecule.partial_charges is not None
+
+    @pytest.mark.parametrize("n_processes", [1, 2, None])
+    def test_create_force_n_processes(self, n_processes):
+        """Test that serial and parallel charge generation give the same results"""
+        from simtk import openmm
+
+        from openforcefield.topology import Molecule, Topology
+
+        acetate = Molecule.from_smiles("CC(=O)[O-]")
+        ammonium = Molecule.from_smiles("[NH4+]")
+        topology = Topology.from_molecules([acetate, ammonium, acetate])
+
+        handler = ChargeIncrementModelHandler(
+            skip_version_check=True,
+            partial_charge_method="formal_charge",
+            number_of_conformers=1,
+        )
+        handler.add_parameter(
+            {
+                "smirks": "[#7:1]-[#1:2]",
+                "charge_increment1": 0.1 * unit.elementary_charge,
+                "charge_increment2": -0.1 * unit.elementary_charge,
+            }
+        )
+        system = openmm.System()
+        force = openmm.NonbondedForce()
+        for _ in range(topology.n_topology_particles):
+            force.addParticle(0.0, 1.0, 0.0)
+        system.addForce(force)
+
+        handler.create_force(
+            system,
+            topology,
+            toolkit_registry=_FormalChargeToolkitWrapper(),
+            n_processes=n_processes,
+        )
+
+        charges = [
+            force.getParticleParameters(idx)[0].value_in_unit(unit.elementary_charge)
+            for idx in range(force.getNumParticles())
+        ]
+        expected_charges = [
+            atom.formal_charge.value_in_unit(unit.elementary_charge)
+            for molecule in (acetate, ammonium, acetate)
+            for atom in molecule.atoms
+        ]
+        for atom in ammonium.atoms:
+            expected_charges[acetate.n_atoms + atom.molecule_atom_index] += (
+                0.4 if atom.atomic_number == 7 else -0.1
+            )
+        assert_almost_equal(charges, expected_charges)
+
+        # The generated conformers are kept on the reference molecules either way
+        for ref_mol in topology.reference_molecules:
+            assert ref_mol.n_conformers == 1
+
+
+class TestToolkitAM1BCCHandler:
+    def test_bond_charge_increment_direction(self):
+        """Test that bond charge increments follow the order of the tagged atoms"""
+        from types import SimpleNamespace
+
+        from simtk import openmm
+
+        from openforcefield.topology import Molecule, Topology
+
+        handler = ToolkitAM1BCCHandler(skip_version_check=True)
+        # <ToolkitAM1BCC> has no parameter type of its own, so use a stand-in. The
+        # oxygen is tagged first but has a higher atom index than the carbon.
+        handler._parameters.append(
+            SimpleNamespace(
+                smirks="[#8:1]-[#6:2]", increment=0.1 * unit.elementary_charge
+            )
+        )
+        molecule = Molecule.from_smiles("CO")
+        carbon_index, oxygen_index = [
+            atom.molecule_atom_index
+            for atom in molecule.atoms
+            if atom.atomic_number in (6, 8)
+        ]
+        assert carbon_index < oxygen_index
+        topology = Topology.from_molecules([molecule])
+
+        system = openmm.System()
+        force = openmm.NonbondedForce()
+        for _ in range(molecule.n_atoms):
+            system.addParticle(1.0)
+            force.addParticle(0.0, 1.0, 0.0)
+        system.addForce(force)
+
+        handler.postprocess_system(system, topology)
+        charges = [
+            force.getParticleParameters(idx)[0].value_in_unit(unit.elementary_charge)
+            for idx in range(molecule.n_atoms)
+        ]
+        assert_almost_equal(charges[oxygen_index], -0.1)
+        assert_almost_equal(charges[carbon_index], 0.1)
+        assert_almost_equal(sum(charges), 0.0)
+
+    @pytest.mark.parametrize("n_processes", [1, 2, None])
+    def test_create_force_n_processes(self, n_processes):
+        """Test that charges are assigned to every molecule, serially or in parallel"""
+        from simtk import openmm
+
+        from openforcefield.topology import Molecule, Topology
+
+        acetate = Molecule.from_smiles("CC(=O)[O-]")
+        ammonium = Molecule.from_smiles("[NH4+]")
+        topology = Topology.from_molecules([acetate, ammonium, acetate])
+
+        handler = ToolkitAM1BCCHandler(skip_version_check=True)
+        system = openmm.System()
+        handler.create_force(
+            system,
+            topology,
+            toolkit_registry=_FormalChargeToolkitWrapper(),
+            n_processes=n_processes,
+        )
+
+        force = system.getForce(0)
+        charges = [
+            force.getParticleParameters(idx)[0].value_in_unit(unit.elementary_charge)
+            for idx in range(force.getNumParticles())
+        ]
+        expected_charges = [
+            atom.formal_charge.value_in_unit(unit.elementary_charge)
+            for molecule in (acetate, ammonium, acetate)
+            for atom in molecule.atoms
+        ]
+        assert_almost_equal(charges, expected_charges)
+
+    @pytest.mark.parametrize("n_processes", [0, -2, 1.5])
+    def test_create_force_invalid_n_processes(self, n_processes):
+        """Test that a non-positive or non-integer number of processes is rejected"""
+        from simtk import openmm
+
+        from openforcefield.topology import Molecule, Topology
+
+        topology = Topology.from_molecules([Molecule.from_smiles("[NH4+]")])
+        handler = ToolkitAM1BCCHandler(skip_version_check=True)
+        with pytest.raises(ValueError, match="n_processes"):
+            handler.create_force(
+                openmm.System(),
+                topology,
+                toolkit_registry=_FormalChargeToolkitWrapper(),
+                n_processes=n_processes,
+            )
+
 
 class TestGBSAHandler:
     def test_create_default_gbsahandler(self):
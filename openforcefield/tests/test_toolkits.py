@@ -1539,6 +1539,21 @@ class TestOpenEyeToolkitWrapper:
         # TODO: Add test for aromaticity
         # TODO: Add test and molecule functionality for isotopes
 
+    def test_smarts_query_cache(self):
+        """Test that OpenEyeToolkitWrapper reuses prepared SMARTS queries"""
+        tk = OpenEyeToolkitWrapper()
+        query = "[#6:2]-[#8:1]"
+        qmol = tk._get_smarts_query(query, "OEAroModel_MDL")
+        assert tk._get_smarts_query(query, "OEAroModel_MDL") is qmol
+
+        molecule = tk.from_smiles("CO")
+        for _ in range(2):
+            matches = molecule.chemical_environment_matches(query, toolkit_registry=tk)
+            assert len(matches) == 1
+
+        with pytest.raises(ValueError):
+            tk._get_smarts_query("[#6:1]-[", "OEAroModel_MDL")
+
 
 @requires_rdkit
 class TestRDKitToolkitWrapper:
@@ -2291,6 +2306,23 @@ class TestRDKitToolkitWrapper:
         # TODO: Add read/write tests for gzipped files
         # TODO: Add write tests for all formats
 
+    def test_smarts_query_cache(self):
+        """Test that RDKitToolkitWrapper reuses parsed SMARTS queries across matches"""
+        tk = RDKitToolkitWrapper()
+        query = "[#6:2]-[#8:1]"
+        qmol, map_list = tk._get_smarts_query(query)
+        assert tk._get_smarts_query(query)[0] is qmol
+        # The tagged atoms are returned in the order of their map indices
+        assert map_list == (1, 0)
+
+        molecule = tk.from_smiles("CO")
+        for _ in range(2):
+            matches = molecule.chemical_environment_matches(query, toolkit_registry=tk)
+            assert len(matches) == 1
+
+        with pytest.raises(ValueError):
+            tk._get_smarts_query("[#6:1]-[")
+
 
 @requires_ambertools
 @requires_rdkit
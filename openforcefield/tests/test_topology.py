@@ -34,6 +34,7 @@ from openforcefield.topology import (
     ImproperDict,
     InvalidBoxVectorsError,
     Molecule,
+    SortedDict,
     Topology,
     ValenceDict,
 )
@@ -98,6 +99,23 @@ def test_cheminformatics_toolkit_is_installed():
         raise Exception(msg)
 
 
+def test_transformed_dict_views():
+    """Test that the items and values of transformed dicts are iterated in key order."""
+    valence_dict = ValenceDict()
+    valence_dict[(3, 2, 1)] = "angle"
+    valence_dict[(0, 5)] = "bond"
+    assert list(valence_dict.items()) == [((0, 5), "bond"), ((1, 2, 3), "angle")]
+    assert list(valence_dict.values()) == ["bond", "angle"]
+    assert ((1, 2, 3), "angle") in valence_dict.items()
+
+    # Later values override earlier ones with the same sorted key.
+    sorted_dict = SortedDict()
+    sorted_dict[(3, 1, 2)] = 1
+    sorted_dict.update({(2, 1, 3): 2, (0, 9): 3})
+    assert list(sorted_dict.items()) == [((0, 9), 3), ((1, 2, 3), 2)]
+    assert len(sorted_dict.values()) == 2
+
+
 class TestTopology(TestCase):
     def setUp(self):
         self.empty_molecule = Molecule()
@@ -438,6 +456,27 @@ class TestTopology(TestCase):
             assert top_vs.atom(0).topology_particle_index == expected_indices[0]
             assert top_vs.atom(1).topology_particle_index == expected_indices[1]
 
+    def test_topology_particle_molecule_particle_index(self):
+        """
+        Test that topology particles report the particle index of their
+        reference particle, including for reordered copies of a molecule
+        """
+        from openforcefield.topology import TopologyAtom
+
+        topology = Topology()
+        topology.add_molecule(self.propane_from_smiles_w_vsites)
+        topology.add_molecule(create_ethanol())
+        topology.add_molecule(create_reversed_ethanol())
+
+        for particle in topology.topology_particles:
+            if isinstance(particle, TopologyAtom):
+                ref_particle = particle.atom
+            else:
+                ref_particle = particle._virtual_particle
+            assert (
+                particle.molecule_particle_index == ref_particle.molecule_particle_index
+            )
+
     def test_is_bonded(self):
         """Test Topology.virtual_site function (get virtual site from index)"""
         topology = Topology()
@@ -23,7 +23,7 @@ Class definitions to represent a molecular system and its chemical components
 
 import itertools
 from collections import OrderedDict
-from collections.abc import MutableMapping
+from collections.abc import ItemsView, MutableMapping, ValuesView
 
 import numpy as np
 from simtk import unit
@@ -96,6 +96,22 @@ class _TransformedDict(MutableMapping):
     def __delitem__(self, key):
         del self.store[self.__keytransform__(key)]
 
+    def update(self, other=(), **kwargs):
+        # Write into the store directly rather than through __setitem__, which is what
+        # MutableMapping.update does for each item.
+        if isinstance(other, dict):
+            items = other.items()
+        elif hasattr(other, "keys"):
+            items = ((key, other[key]) for key in other.keys())
+        else:
+            items = other
+        store = self.store
+        keytransform = self.__keytransform__
+        for key, value in items:
+            store[keytransform(key)] = value
+        for key, value in kwargs.items():
+            store[keytransform(key)] = value
+
     def __iter__(self):
         return iter(sorted(self.store, key=self.__sortfunc__))
 
@@ -109,6 +125,36 @@ class _TransformedDict(MutableMapping):
     def __sortfunc__(key):
         return key
 
+    def items(self):
+        return _TransformedDictItemsView(self)
+
+    def values(self):
+        return _TransformedDictValuesView(self)
+
+
+class _TransformedDictItemsView(ItemsView):
+    """Items view of a _TransformedDict.
+
+    The keys yielded by iterating a _TransformedDict are already transformed, so
+    their values are read from the underlying store directly instead of
+    transforming each key again as ``ItemsView`` would.
+
+    """
+
+    def __iter__(self):
+        store = self._mapping.store
+        for key in self._mapping:
+            yield (key, store[key])
+
+
+class _TransformedDictValuesView(ValuesView):
+    """Values view of a _TransformedDict, see _TransformedDictItemsView."""
+
+    def __iter__(self):
+        store = self._mapping.store
+        for key in self._mapping:
+            yield store[key]
+
 
 # TODO: Encapsulate this atom ordering logic directly into Atom/Bond/Angle/Torsion classes?
 class ValenceDict(_TransformedDict):
@@ -354,6 +400,20 @@ class TopologyAtom(Serializable):
         """
         return self._topology_molecule.molecule
 
+    @property
+    def molecule_particle_index(self):
+        """
+        Get the index of the reference Atom among the particles of its reference Molecule.
+
+        Returns
+        -------
+        int
+            The index of the reference atom in the particles of the reference molecule.
+        """
+        # Atoms precede virtual sites in the particles of a Molecule, so this is also
+        # the atom index, which is found without building the list of particles.
+        return self._atom.molecule_atom_index
+
     @property
     def topology_atom_index(self):
         """
@@ -783,6 +843,18 @@ class TopologyVirtualParticle(TopologyVirtualSite):
 
         return same_ptl
 
+    @property
+    def molecule_particle_index(self):
+        """
+        Get the index of the reference virtual particle among the particles of its reference Molecule.
+
+        Returns
+        -------
+        int
+            The index of the reference virtual particle in the particles of the reference molecule.
+        """
+        return self._virtual_particle.molecule_particle_index
+
     @property
     def topology_particle_index(self):
         """
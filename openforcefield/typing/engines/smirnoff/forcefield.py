@@ -1241,6 +1241,15 @@ class ForceField:
             A `ValueError` will be raised if any bonds have ``fractional_bond_order=None``.
             Molecules in the topology not represented in this list will have fractional
             bond orders calculated using underlying toolkits as needed.
+        force_regenerate_conformers : bool, optional. default=False
+            If ``True``, ``ChargeIncrementModel`` sections generate new conformers for
+            every molecule they assign charges to, even if the molecule already has
+            ``number_of_conformers`` conformers.
+        n_processes : int or None, optional. default=1
+            If greater than 1, the partial charges of distinct molecules are computed
+            concurrently with up to this many processes by ``ToolkitAM1BCC`` and
+            ``ChargeIncrementModel`` sections. If ``None``, ``os.cpu_count()``
+            processes are used.
         return_topology : bool, optional. default=False
             If ``True``, return tuple of ``(system, topology)``, where
             ``topology`` is the processed topology. Default ``False``. This topology will have the
@@ -45,18 +45,29 @@ __all__ = [
 # =============================================================================================
 
 import abc
+import bisect
 import copy
 import functools
 import inspect
 import logging
+import os
 import re
+import weakref
 from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from itertools import combinations
 
+import numpy as np
 from simtk import openmm, unit
 
-from openforcefield.topology import ImproperDict, SortedDict, Topology, ValenceDict
+from openforcefield.topology import (
+    ImproperDict,
+    SortedDict,
+    Topology,
+    TopologyVirtualParticle,
+    ValenceDict,
+)
 from openforcefield.topology.molecule import Molecule
 from openforcefield.typing.chemistry import ChemicalEnvironment
 from openforcefield.utils import (
@@ -209,54 +220,249 @@ def _linear_inter_or_extrapolate(points_dict, x_query):
         )
     # TODO: error out for nonsensical fractional bond orders
 
-    # find the nearest point beneath our queried x value
-    try:
-        below = max(bo for bo in points_dict if bo < x_query)
-    except ValueError:
-        below = None
-    # find the nearest point above our queried x value
-    try:
-        above = min(bo for bo in points_dict if bo > x_query)
-    except ValueError:
-        above = None
-
-    # handle case where we can clearly interpolate
-    if (above is not None) and (below is not None):
-        return points_dict[below] + (points_dict[above] - points_dict[below]) * (
-            (x_query - below) / (above - below)
-        )
+    bond_orders = sorted(points_dict)
 
     # error if we can't hope to interpolate at all
-    elif (above is None) and (below is None):
+    if not (bond_orders[0] < x_query or x_query < bond_orders[-1]):
         raise NotImplementedError(
             f"Failed to find interpolation references for "
             f"`x_query` '{x_query}', "
             f"with `points_dict` '{points_dict}'"
         )
 
-    # extrapolate for fractional bond orders below our lowest defined bond order
-    elif below is None:
-        bond_orders = sorted(points_dict)
-        k = points_dict[bond_orders[0]] - (
-            (points_dict[bond_orders[1]] - points_dict[bond_orders[0]])
-            / (bond_orders[1] - bond_orders[0])
-        ) * (bond_orders[0] - x_query)
-        return k
-
-    # extrapolate for fractional bond orders above our highest defined bond order
-    elif above is None:
-        bond_orders = sorted(points_dict)
-        k = points_dict[bond_orders[-1]] + (
-            (points_dict[bond_orders[-1]] - points_dict[bond_orders[-2]])
-            / (bond_orders[-1] - bond_orders[-2])
-        ) * (x_query - bond_orders[-1])
-        return k
+    # find the nearest points beneath and above our queried x value. Below the lowest
+    # or above the highest defined bond order, we extrapolate from the first or last
+    # two points respectively.
+    above_idx = bisect.bisect_left(bond_orders, x_query)
+    above_idx = min(max(above_idx, 1), len(bond_orders) - 1)
+    below = bond_orders[above_idx - 1]
+    above = bond_orders[above_idx]
+    y_below = points_dict[below]
+    y_above = points_dict[above]
+    fraction = (x_query - below) / (above - below)
+
+    # Quantity arithmetic is much slower than float arithmetic, so strip the
+    # units and attach them only to the result.
+    if isinstance(y_below, unit.Quantity):
+        y_unit = y_below.unit
+        y_below = y_below.value_in_unit(y_unit)
+        y_above = y_above.value_in_unit(y_unit)
+        return (y_below + (y_above - y_below) * fraction) * y_unit
+    return y_below + (y_above - y_below) * fraction
+
+
+# Index of the first Force of each type in the Systems being parametrized. Systems that
+# cannot be weakly referenced are simply not cached.
+_SYSTEM_FORCE_INDICES = weakref.WeakKeyDictionary()
+
+
+def _get_force_indices_cache(system):
+    """Return the dict of cached ``{force_type: force_index}`` for a System."""
+    try:
+        return _SYSTEM_FORCE_INDICES.setdefault(system, dict())
+    except TypeError:
+        return dict()
+
+
+def _get_force(system, openmm_type):
+    """Retrieve the first Force of the given type in an OpenMM System.
+
+    The index of the Force is cached per System, so that handlers sharing the same
+    Force (e.g. all nonbonded handlers) do not each have to scan all the forces.
+
+    Parameters
+    ----------
+    system : simtk.openmm.System
+        The System to search.
+    openmm_type : type
+        The class of the Force. Subclasses are not considered a match.
+
+    Returns
+    -------
+    force : simtk.openmm.Force or None
+        The Force, or None if the System does not contain a Force of this type.
+    """
+    force_indices = _get_force_indices_cache(system)
+
+    # Validate the cached index since forces may have been removed from the System.
+    force_idx = force_indices.get(openmm_type)
+    if force_idx is not None and force_idx < system.getNumForces():
+        force = system.getForce(force_idx)
+        if type(force) == openmm_type:
+            return force
+
+    for force_idx in range(system.getNumForces()):
+        force = system.getForce(force_idx)
+        if type(force) == openmm_type:
+            force_indices[openmm_type] = force_idx
+            return force
+    return None
+
+
+def _add_force(system, force):
+    """Add a Force to an OpenMM System and cache its index for ``_get_force``."""
+    force_idx = system.addForce(force)
+    force_indices = _get_force_indices_cache(system)
+    force_indices.setdefault(type(force), force_idx)
+
+
+def _get_particle_charges(force):
+    """Return the charges of all the particles of a NonbondedForce as a float array
+    in units of elementary charge.
+
+    Reading all the charges in one pass is cheaper than calling
+    ``getParticleParameters`` each time a charge is needed.
+    """
+    n_particles = force.getNumParticles()
+    get_particle_parameters = force.getParticleParameters
+    return np.fromiter(
+        (
+            get_particle_parameters(particle_index)[0].value_in_unit(
+                unit.elementary_charge
+            )
+            for particle_index in range(n_particles)
+        ),
+        dtype=float,
+        count=n_particles,
+    )
+
+
+def _get_bonds_by_atom_indices(molecule):
+    """Return a dict mapping the frozenset of the two atom indices of each bond
+    in the molecule to the bond.
+
+    Looking up many bonds through this dict avoids the type checks and the walk
+    over the atom's bonds of ``Molecule.get_bond_between``. The dict is not
+    stored on the molecule, which may be modified, so build it once per use.
+    """
+    return {
+        frozenset((bond.atom1_index, bond.atom2_index)): bond for bond in molecule.bonds
+    }
+
+
+def _molecule_invariants(molecule):
+    """Return a tuple of cheap graph invariants of the molecule: its number of
+    atoms, its total formal charge and the sorted atomic numbers of its atoms.
+
+    Molecules with different invariants cannot be isomorphic, so comparing
+    these is a quick way to reject candidates before a costlier comparison.
+    """
+    atoms = molecule.atoms
+    total_formal_charge = sum(
+        atom.formal_charge.value_in_unit(unit.elementary_charge) for atom in atoms
+    )
+    return (
+        len(atoms),
+        round(total_formal_charge),
+        tuple(sorted(atom.atomic_number for atom in atoms)),
+    )
+
+
+# Atom maps found by _stringent_isomorphism_atom_map(), keyed by the mapped SMILES of
+# the two molecules, which fully determine the labelled graphs being matched. The
+# least recently used entries are evicted beyond _STRINGENT_ATOM_MAPS_MAX_SIZE.
+_STRINGENT_ATOM_MAPS = OrderedDict()
+_STRINGENT_ATOM_MAPS_MAX_SIZE = 1024
+
+
+def _stringent_isomorphism_atom_map(mol1, mol2):
+    """Return an atom map between two molecules that are isomorphic with every
+    matching option of ``Molecule.are_isomorphic`` enabled, or None if they are not.
+
+    Results are memoized, so matching copies of the same molecules again (e.g.
+    when the same molecules are parametrized in a new Topology) skips the
+    isomorphism search.
+    """
+    # Mapped SMILES only encode the atom order if no custom atom map is set.
+    if "atom_map" in mol1.properties or "atom_map" in mol2.properties:
+        return _find_stringent_isomorphism_atom_map(mol1, mol2)
+
+    key = (mol1.to_smiles(mapped=True), mol2.to_smiles(mapped=True))
+    try:
+        atom_map = _STRINGENT_ATOM_MAPS[key]
+    except KeyError:
+        atom_map = _find_stringent_isomorphism_atom_map(mol1, mol2)
+        _STRINGENT_ATOM_MAPS[key] = atom_map
+        if len(_STRINGENT_ATOM_MAPS) > _STRINGENT_ATOM_MAPS_MAX_SIZE:
+            _STRINGENT_ATOM_MAPS.popitem(last=False)
+    else:
+        _STRINGENT_ATOM_MAPS.move_to_end(key)
+
+    if atom_map is None:
+        return None
+    return dict(atom_map)
+
+
+def _find_stringent_isomorphism_atom_map(mol1, mol2):
+    """Search the atom map returned by ``_stringent_isomorphism_atom_map``.
+
+    A cheap search matching only elements and aromaticity is tried first. With
+    aromatic matching enabled, bond order matching adds nothing to the edge
+    comparison of ``are_isomorphic``, so the candidate map only needs its
+    formal charges and stereochemistry verified. If the verification fails
+    (e.g. a symmetric permutation or a pyrimidal nitrogen stereo label), the
+    fully stringent search is run.
+    """
+    isomorphic, atom_map = Molecule.are_isomorphic(
+        mol1,
+        mol2,
+        return_atom_map=True,
+        aromatic_matching=True,
+        formal_charge_matching=False,
+        bond_order_matching=False,
+        atom_stereochemistry_matching=False,
+        bond_stereochemistry_matching=False,
+        strip_pyrimidal_n_atom_stereo=False,
+    )
+    if not isomorphic:
+        return None
+
+    mol2_atoms = mol2.atoms
+    verified = all(
+        atom.formal_charge == mol2_atoms[atom_map[atom_idx]].formal_charge
+        and atom.stereochemistry == mol2_atoms[atom_map[atom_idx]].stereochemistry
+        for atom_idx, atom in enumerate(mol1.atoms)
+    )
+    if verified:
+        mol2_bonds = _get_bonds_by_atom_indices(mol2)
+        for bond in mol1.bonds:
+            mol2_bond = mol2_bonds[
+                frozenset((atom_map[bond.atom1_index], atom_map[bond.atom2_index]))
+            ]
+            if bond.stereochemistry != mol2_bond.stereochemistry:
+                verified = False
+                break
+    if verified:
+        return atom_map
+
+    isomorphic, atom_map = Molecule.are_isomorphic(
+        mol1,
+        mol2,
+        return_atom_map=True,
+        aromatic_matching=True,
+        formal_charge_matching=True,
+        bond_order_matching=True,
+        atom_stereochemistry_matching=True,
+        bond_stereochemistry_matching=True,
+    )
+    return atom_map if isomorphic else None
+
+
+# Validators returned by _allow_only(), keyed by the frozenset of allowed values.
+_ALLOWED_VALUES_CHECKERS = dict()
 
 
 # TODO: This is technically a validator, not a converter, but ParameterAttribute doesn't support them yet (it'll be easy if we switch to use the attrs library).
 def _allow_only(allowed_values):
-    """A converter that checks the new value is only in a set."""
+    """A converter that checks the new value is only in a set.
+
+    Equal sets of allowed values share the same converter.
+    """
     allowed_values = frozenset(allowed_values)
+    try:
+        return _ALLOWED_VALUES_CHECKERS[allowed_values]
+    except KeyError:
+        pass
 
     def _value_checker(instance, attr, new_value):
         # This statement means that, in the "SMIRNOFF Data Dict" format, the string "None"
@@ -270,11 +476,12 @@ def _allow_only(allowed_values):
             err_msg = (
                 f"Attempted to set {instance.__class__.__name__}.{attr.name} "
                 f"to {new_value}. Currently, only the following values "
-                f"are supported: {sorted(allowed_values)}."
+                f"are supported: {sorted(allowed_values, key=str)}."
             )
             raise SMIRNOFFSpecError(err_msg)
         return new_value
 
+    _ALLOWED_VALUES_CHECKERS[allowed_values] = _value_checker
     return _value_checker
 
 
@@ -404,6 +611,9 @@ class ParameterAttribute:
         self.default = default
         self._unit = unit
         self._converter = converter
+        # Whether the converter is a static function (True) or takes the instance
+        # and the attribute as well (False). Unknown until the first successful call.
+        self._converter_is_static = None
 
     def __set_name__(self, owner, name):
         self._name = "_" + name
@@ -418,6 +628,14 @@ class ParameterAttribute:
             # This is called from the class. Return the descriptor object.
             return self
 
+        # Values set through this descriptor are stored in the instance
+        # dictionary. Look them up directly to avoid going through the
+        # (potentially expensive) __getattr__ of _ParameterAttributeHandler.
+        try:
+            return instance.__dict__[self._name]
+        except (AttributeError, KeyError):
+            pass
+
         try:
             return getattr(instance, self._name)
         except AttributeError:
@@ -476,13 +694,24 @@ class ParameterAttribute:
 
     def _call_converter(self, value, instance):
         """Correctly calls static and instance converters."""
-        if self._converter is not None:
-            try:
-                # Static function.
-                return self._converter(value)
-            except TypeError:
-                # Instance method.
-                return self._converter(instance, self, value)
+        if self._converter is None:
+            return value
+        if self._converter_is_static is True:
+            return self._converter(value)
+        if self._converter_is_static is False:
+            return self._converter(instance, self, value)
+
+        # The calling convention is resolved on the first call, so that
+        # later calls don't have to go through a raised TypeError.
+        try:
+            # Static function.
+            value = self._converter(value)
+        except TypeError:
+            # Instance method.
+            value = self._converter(instance, self, value)
+            self._converter_is_static = False
+        else:
+            self._converter_is_static = True
         return value
 
 
@@ -2354,6 +2583,7 @@ class ParameterHandler(_ParameterAttributeHandler):
         assigned_terms,
         valence_terms,
         exception_cls=UnassignedValenceParameterException,
+        n_valence_terms=None,
     ):
         """Check that all valence terms have been assigned and print a user-friendly error message.
 
@@ -2366,6 +2596,10 @@ class ParameterHandler(_ParameterAttributeHandler):
         exception_cls : UnassignedValenceParameterException
             A specific exception class to raise to allow catching only specific
             types of errors.
+        n_valence_terms : int, optional
+            The number of terms in ``valence_terms``. If given, ``valence_terms``
+            can be a generator, and it is consumed only if the number of assigned
+            terms differs from ``n_valence_terms``.
 
         """
         from openforcefield.topology import TopologyAtom
@@ -2379,8 +2613,12 @@ class ParameterHandler(_ParameterAttributeHandler):
         # The fact that we graph match all topol molecules to ref
         # molecules should avoid the len(not_found_terms) > 0 case.
 
-        if len(assigned_terms) == len(valence_terms):
+        if n_valence_terms is None:
+            valence_terms = list(valence_terms)
+            n_valence_terms = len(valence_terms)
+        if len(assigned_terms) == n_valence_terms:
             return
+        valence_terms = list(valence_terms)
 
         # Convert the valence term to a valence dictionary to make sure
         # the order of atom indices doesn't matter for comparison.
@@ -2492,41 +2730,52 @@ class ParameterHandler(_ParameterAttributeHandler):
 
     @staticmethod
     def check_partial_bond_orders_from_molecules_duplicates(pb_mols):
-        if len(set(map(Molecule.to_smiles, pb_mols))) < len(pb_mols):
-            raise ValueError(
-                "At least two user-provided fractional bond order "
-                "molecules are isomorphic"
-            )
+        # Canonical isomeric SMILES are the key used to match these molecules to the
+        # topology (see assign_partial_bond_orders_from_molecules), so duplicates are
+        # detected with the same key. Keys that merge tautomers or protonation
+        # states, such as standard InChIKeys, would reject valid inputs.
+        # Molecule.to_smiles caches its result on each molecule, so repeated
+        # calls are cheap. Stop as soon as the first duplicate is found.
+        seen_smiles = set()
+        for pb_mol in pb_mols:
+            smiles = pb_mol.to_smiles()
+            if smiles in seen_smiles:
+                raise ValueError(
+                    "At least two user-provided fractional bond order "
+                    "molecules are isomorphic"
+                )
+            seen_smiles.add(smiles)
 
     @staticmethod
     def assign_partial_bond_orders_from_molecules(topology, pbo_mols):
+        # Like Topology.add_molecule, use canonical SMILES as a cheap prefilter, so that the
+        # expensive isomorphism check is only run (to get the atom map) on molecules that can match.
+        pbo_mols_by_smiles = defaultdict(list)
+        for pbo_mol in pbo_mols:
+            pbo_mols_by_smiles[pbo_mol.to_smiles()].append(pbo_mol)
+
         # for each reference molecule in our topology, we'll walk through the provided partial bond order molecules
         # if we find a match, we'll apply the partial bond orders and skip to the next molecule
         for ref_mol in topology.reference_molecules:
-            for pbo_mol in pbo_mols:
+            for pbo_mol in pbo_mols_by_smiles.get(ref_mol.to_smiles(), []):
                 # we are as stringent as we are in the ElectrostaticsHandler
-                # TODO: figure out whether bond order matching is redundant with aromatic matching
-                isomorphic, topology_atom_map = Molecule.are_isomorphic(
-                    ref_mol,
-                    pbo_mol,
-                    return_atom_map=True,
-                    aromatic_matching=True,
-                    formal_charge_matching=True,
-                    bond_order_matching=True,
-                    atom_stereochemistry_matching=True,
-                    bond_stereochemistry_matching=True,
-                )
+                topology_atom_map = _stringent_isomorphism_atom_map(ref_mol, pbo_mol)
 
                 # if matching, assign bond orders and skip to next molecule
                 # first match wins
-                if isomorphic:
+                if topology_atom_map is not None:
+                    pbo_bonds = _get_bonds_by_atom_indices(pbo_mol)
                     # walk through bonds on reference molecule
                     for bond in ref_mol.bonds:
                         # use atom mapping to translate to pbo_molecule bond
-                        pbo_bond = pbo_mol.get_bond_between(
-                            topology_atom_map[bond.atom1_index],
-                            topology_atom_map[bond.atom2_index],
-                        )
+                        pbo_bond = pbo_bonds[
+                            frozenset(
+                                (
+                                    topology_atom_map[bond.atom1_index],
+                                    topology_atom_map[bond.atom2_index],
+                                )
+                            )
+                        ]
                         # extract fractional bond order
                         # assign fractional bond order to reference molecule bond
                         if pbo_bond.fractional_bond_order is None:
@@ -2727,13 +2976,10 @@ class BondHandler(ParameterHandler):
         # Create or retrieve existing OpenMM Force object
         # TODO: The commented line below should replace the system.getForce search
         # force = super(BondHandler, self).create_force(system, topology, **kwargs)
-        existing = [system.getForce(i) for i in range(system.getNumForces())]
-        existing = [f for f in existing if type(f) == self._OPENMMTYPE]
-        if len(existing) == 0:
+        force = _get_force(system, self._OPENMMTYPE)
+        if force is None:
             force = self._OPENMMTYPE()
-            system.addForce(force)
-        else:
-            force = existing[0]
+            _add_force(system, force)
 
         # Do not trust previously-calculated partial bond orders, since we don't know
         # what method was used to assign them
@@ -2764,108 +3010,44 @@ class BondHandler(ParameterHandler):
         # Add all bonds to the system.
         bond_matches = self.find_matches(topology)
 
-        skipped_constrained_bonds = (
-            0  # keep track of how many bonds were constrained (and hence skipped)
-        )
+        # Split the matches into bonds that need a harmonic term and bonds that
+        # still need a constraint distance. Bonds constrained to a known
+        # distance are skipped outright, so their parameters are never computed.
+        unconstrained_matches = []
+        unassigned_constraint_matches = []
         for (topology_atom_indices, bond_match) in bond_matches.items():
-            # Get corresponding particle indices in Topology
-            # particle_indices = tuple([ atom.particle_index for atom in atoms ])
-
-            # Ensure atoms are actually bonded correct pattern in Topology
-            self._assert_correct_connectivity(bond_match)
-
-            # topology.assert_bonded(atoms[0], atoms[1])
-            bond_params = bond_match.parameter_type
-            match = bond_match.environment_match
+            is_constrained = topology.is_constrained(*topology_atom_indices)
+            if not is_constrained:
+                unconstrained_matches.append((topology_atom_indices, bond_match))
+            elif is_constrained is True:
+                unassigned_constraint_matches.append(
+                    (topology_atom_indices, bond_match)
+                )
+        # keep track of how many bonds were constrained (and hence skipped)
+        skipped_constrained_bonds = len(bond_matches) - len(unconstrained_matches)
 
-            # Compute equilibrium bond length and spring constant.
-            bond = match.reference_molecule.get_bond_between(
-                *match.reference_atom_indices
-            )
+        # The same BondType is usually matched by many bonds. Resolve its
+        # ParameterAttributes once instead of once per matched bond.
+        resolved_bond_params = dict()
+        toolkit_registry = kwargs.get("toolkit_registry", GLOBAL_TOOLKIT_REGISTRY)
 
-            length_requires_interpolation = (
-                getattr(bond_params, "length_bondorder", None) is not None
+        for (topology_atom_indices, bond_match) in unconstrained_matches:
+            length, k = self._get_bond_parameters(
+                bond_match, resolved_bond_params, toolkit_registry
             )
-            k_requires_interpolation = (
-                getattr(bond_params, "k_bondorder", None) is not None
+            # Add harmonic bond to HarmonicBondForce
+            force.addBond(*topology_atom_indices, length, k)
+
+        for (topology_atom_indices, bond_match) in unassigned_constraint_matches:
+            # Atom pair is constrained; we don't need to add a bond term, only
+            # the constraint at the equilibrium bond length.
+            length, _ = self._get_bond_parameters(
+                bond_match, resolved_bond_params, toolkit_registry
             )
-
-            # Calculate fractional bond orders for this molecule only if needed.
-            if (
-                length_requires_interpolation or k_requires_interpolation
-            ) and bond.fractional_bond_order is None:
-                toolkit_registry = kwargs.get(
-                    "toolkit_registry", GLOBAL_TOOLKIT_REGISTRY
-                )
-                match.reference_molecule.assign_fractional_bond_orders(
-                    toolkit_registry=toolkit_registry,
-                    use_conformers=match.reference_molecule.conformers,
-                    bond_order_model=self.fractional_bondorder_method.lower(),
-                )
-
-            if not length_requires_interpolation:
-                length = bond_params.length
-            else:
-                # Interpolate length using fractional bond orders
-                bond_order = bond.fractional_bond_order
-                if self.fractional_bondorder_interpolation == "linear":
-                    if len(bond_params.length_bondorder) < 2:
-                        raise SMIRNOFFSpecError(
-                            "In order to use bond order interpolation, 2 or more parameters "
-                            f"must be present. Found {len(bond_params.length_bondorder)} parameters."
-                        )
-                    length = _linear_inter_or_extrapolate(
-                        points_dict=bond_params.length_bondorder,
-                        x_query=bond_order,
-                    )
-                else:
-                    # TODO: This code is effectively unreachable due to the the _allow_only converter used in this
-                    #       ParameterAttribute's definition, which only allows "linear". Remove?
-                    raise FractionalBondOrderInterpolationMethodUnsupportedError(
-                        "Fractional bondorder interpolation method {} is not implemented.".format(
-                            self.fractional_bondorder_interpolation
-                        )
-                    )
-            if not k_requires_interpolation:
-                k = bond_params.k
-            else:
-                # Interpolate k using fractional bond orders
-                bond_order = bond.fractional_bond_order
-                if self.fractional_bondorder_interpolation == "linear":
-                    if len(bond_params.k_bondorder) < 2:
-                        raise SMIRNOFFSpecError(
-                            "In order to use bond order interpolation, 2 or more parameters "
-                            f"must be present. Found {len(bond_params.k_bondorder)} parameters."
-                        )
-                    k = _linear_inter_or_extrapolate(
-                        points_dict=bond_params.k_bondorder,
-                        x_query=bond_order,
-                    )
-                else:
-                    # TODO: This code is effectively unreachable due to the the _allow_only converter used in this
-                    #       ParameterAttribute's definition, which only allows "linear". Remove?
-                    raise FractionalBondOrderInterpolationMethodUnsupportedError(
-                        "Fractional bondorder interpolation method {} is not implemented.".format(
-                            self.fractional_bondorder_interpolation
-                        )
-                    )
-
-            # If this pair of atoms is subject to a constraint, only use the length
-            is_constrained = topology.is_constrained(*topology_atom_indices)
-            if not is_constrained:
-                # Add harmonic bond to HarmonicBondForce
-                force.addBond(*topology_atom_indices, length, k)
-            else:
-                # Handle constraints.
-                # Atom pair is constrained; we don't need to add a bond term.
-                skipped_constrained_bonds += 1
-                # Check if we need to add the constraint here to the equilibrium bond length.
-                if is_constrained is True:
-                    # Mark that we have now assigned a specific constraint distance to this constraint.
-                    topology.add_constraint(*topology_atom_indices, length)
-                    # Add the constraint to the System.
-                    system.addConstraint(*topology_atom_indices, length)
-                    # system.addConstraint(*particle_indices, length)
+            # Mark that we have now assigned a specific constraint distance to this constraint.
+            topology.add_constraint(*topology_atom_indices, length)
+            # Add the constraint to the System.
+            system.addConstraint(*topology_atom_indices, length)
 
         logger.info(
             "{} bonds added ({} skipped due to constraints)".format(
@@ -2874,13 +3056,99 @@ class BondHandler(ParameterHandler):
         )
 
         # Check that no topological bonds are missing force parameters.
-        valence_terms = [list(b.atoms) for b in topology.topology_bonds]
         self._check_all_valence_terms_assigned(
             assigned_terms=bond_matches,
-            valence_terms=valence_terms,
+            valence_terms=(list(b.atoms) for b in topology.topology_bonds),
             exception_cls=UnassignedBondParameterException,
+            n_valence_terms=topology.n_topology_bonds,
         )
 
+    def _get_bond_parameters(self, bond_match, resolved_bond_params, toolkit_registry):
+        """Compute the equilibrium length and force constant of a matched bond.
+
+        Fractional bond orders are assigned to the reference molecule if the
+        matched ``BondType`` requires interpolation and they are not yet available.
+
+        Parameters
+        ----------
+        bond_match : ParameterHandler._Match
+            The match returned by ``find_matches``.
+        resolved_bond_params : dict
+            Cache of ``{BondType: (length, k, length_bondorder, k_bondorder)}``
+            shared between calls. Missing entries are added.
+        toolkit_registry : openforcefield.utils.toolkits.ToolkitRegistry
+            The toolkit registry used to compute fractional bond orders.
+
+        Returns
+        -------
+        length : simtk.unit.Quantity
+        k : simtk.unit.Quantity
+        """
+        # Ensure atoms are actually bonded correct pattern in Topology
+        self._assert_correct_connectivity(bond_match)
+
+        bond_params = bond_match.parameter_type
+        match = bond_match.environment_match
+        bond = match.reference_molecule.get_bond_between(*match.reference_atom_indices)
+
+        resolved = resolved_bond_params.get(bond_params)
+        if resolved is None:
+            resolved = (
+                bond_params.length,
+                bond_params.k,
+                bond_params.length_bondorder,
+                bond_params.k_bondorder,
+            )
+            resolved_bond_params[bond_params] = resolved
+        length, k, length_bondorder, k_bondorder = resolved
+
+        length_requires_interpolation = length_bondorder is not None
+        k_requires_interpolation = k_bondorder is not None
+        if not (length_requires_interpolation or k_requires_interpolation):
+            return length, k
+
+        # Calculate fractional bond orders for this molecule only if needed.
+        if bond.fractional_bond_order is None:
+            match.reference_molecule.assign_fractional_bond_orders(
+                toolkit_registry=toolkit_registry,
+                use_conformers=match.reference_molecule.conformers,
+                bond_order_model=self.fractional_bondorder_method.lower(),
+            )
+        bond_order = bond.fractional_bond_order
+
+        if self.fractional_bondorder_interpolation != "linear":
+            # TODO: This code is effectively unreachable due to the the _allow_only converter used in this
+            #       ParameterAttribute's definition, which only allows "linear". Remove?
+            raise FractionalBondOrderInterpolationMethodUnsupportedError(
+                "Fractional bondorder interpolation method {} is not implemented.".format(
+                    self.fractional_bondorder_interpolation
+                )
+            )
+
+        if length_requires_interpolation:
+            # Interpolate length using fractional bond orders
+            if len(length_bondorder) < 2:
+                raise SMIRNOFFSpecError(
+                    "In order to use bond order interpolation, 2 or more parameters "
+                    f"must be present. Found {len(length_bondorder)} parameters."
+                )
+            length = _linear_inter_or_extrapolate(
+                points_dict=length_bondorder,
+                x_query=bond_order,
+            )
+        if k_requires_interpolation:
+            # Interpolate k using fractional bond orders
+            if len(k_bondorder) < 2:
+                raise SMIRNOFFSpecError(
+                    "In order to use bond order interpolation, 2 or more parameters "
+                    f"must be present. Found {len(k_bondorder)} parameters."
+                )
+            k = _linear_inter_or_extrapolate(
+                points_dict=k_bondorder,
+                x_query=bond_order,
+            )
+        return length, k
+
 
 # =============================================================================================
 
@@ -2931,13 +3199,10 @@ class AngleHandler(ParameterHandler):
 
     def create_force(self, system, topology, **kwargs):
         # force = super(AngleHandler, self).create_force(system, topology, **kwargs)
-        existing = [system.getForce(i) for i in range(system.getNumForces())]
-        existing = [f for f in existing if type(f) == self._OPENMMTYPE]
-        if len(existing) == 0:
+        force = _get_force(system, self._OPENMMTYPE)
+        if force is None:
             force = self._OPENMMTYPE()
-            system.addForce(force)
-        else:
-            force = existing[0]
+            _add_force(system, force)
 
         # Add all angles to the system.
         angle_matches = self.find_matches(topology)
@@ -2973,8 +3238,9 @@ class AngleHandler(ParameterHandler):
         # Check that no topological angles are missing force parameters
         self._check_all_valence_terms_assigned(
             assigned_terms=angle_matches,
-            valence_terms=list(topology.angles),
+            valence_terms=topology.angles,
             exception_cls=UnassignedAngleParameterException,
+            n_valence_terms=topology.n_angles,
         )
 
 
@@ -3056,14 +3322,10 @@ class ProperTorsionHandler(ParameterHandler):
 
     def create_force(self, system, topology, **kwargs):
         # force = super(ProperTorsionHandler, self).create_force(system, topology, **kwargs)
-        existing = [system.getForce(i) for i in range(system.getNumForces())]
-        existing = [f for f in existing if type(f) == self._OPENMMTYPE]
-
-        if len(existing) == 0:
+        force = _get_force(system, self._OPENMMTYPE)
+        if force is None:
             force = self._OPENMMTYPE()
-            system.addForce(force)
-        else:
-            force = existing[0]
+            _add_force(system, force)
 
         # Do not trust previously-calculated partial bond orders, since we don't know
         # what method was used to assign them
@@ -3096,6 +3358,16 @@ class ProperTorsionHandler(ParameterHandler):
         # but gives back matches for atoms for instance molecules
         torsion_matches = self.find_matches(topology)
 
+        # Torsion terms stripped of their units, keyed by parameter type. For
+        # interpolated terms, the key also includes the fractional bond order
+        # of the central bond, so that all copies of a molecule (and equivalent
+        # torsions within a molecule) share the same interpolated values.
+        torsion_terms_cache = dict()
+        interpolated_terms_cache = dict()
+
+        # Torsion terms are collected first and added to the force in one pass.
+        torsions_to_add = []
+
         for (atom_indices, torsion_match) in torsion_matches.items():
             # Ensure atoms are actually bonded correct pattern in Topology
             # Currently does nothing
@@ -3107,7 +3379,12 @@ class ProperTorsionHandler(ParameterHandler):
                 # only count a given `kX_bondorder*` once
 
                 # assign torsion with no interpolation
-                self._assign_torsion(atom_indices, torsion_match, force)
+                self._assign_torsion(
+                    atom_indices,
+                    torsion_match,
+                    torsions_to_add,
+                    torsion_terms_cache=torsion_terms_cache,
+                )
             else:
                 # TODO: add a check here that we have same number of terms for
                 # `kX_bondorder*`, `periodicityX`, `phaseX`
@@ -3115,9 +3392,17 @@ class ProperTorsionHandler(ParameterHandler):
 
                 # assign torsion with interpolation
                 self._assign_fractional_bond_orders(
-                    atom_indices, torsion_match, force, **kwargs
+                    atom_indices,
+                    torsion_match,
+                    torsions_to_add,
+                    interpolated_terms_cache=interpolated_terms_cache,
+                    **kwargs,
                 )
 
+        add_torsion = force.addTorsion
+        for torsion_args in torsions_to_add:
+            add_torsion(*torsion_args)
+
         logger.info("{} torsions added".format(len(torsion_matches)))
 
         # Check that no topological torsions are missing force parameters
@@ -3131,14 +3416,27 @@ class ProperTorsionHandler(ParameterHandler):
         # exactly this.
         self._check_all_valence_terms_assigned(
             assigned_terms=torsion_matches,
-            valence_terms=list(topology.propers),
+            valence_terms=topology.propers,
             exception_cls=UnassignedProperTorsionParameterException,
+            n_valence_terms=topology.n_propers,
         )
 
-    def _assign_torsion(self, atom_indices, torsion_match, force):
+    @staticmethod
+    def _get_torsion_terms(torsion_params):
+        """Convert the terms of a torsion type without interpolation into plain floats.
 
-        torsion_params = torsion_match.parameter_type
+        Parameters
+        ----------
+        torsion_params : ProperTorsionHandler.ProperTorsionType
+            The torsion type.
 
+        Returns
+        -------
+        terms : list of tuple
+            A ``(periodicity, phase, k / idivf)`` tuple for each term, with the phase
+            in radians and the force constant in kJ/mol, as expected by OpenMM.
+        """
+        terms = []
         for (periodicity, phase, k, idivf) in zip(
             torsion_params.periodicity,
             torsion_params.phase,
@@ -3153,31 +3451,120 @@ class ProperTorsionHandler(ParameterHandler):
                     "support for the torsion `idivf` value of 'auto'"
                 )
 
-            force.addTorsion(
-                atom_indices[0],
-                atom_indices[1],
-                atom_indices[2],
-                atom_indices[3],
-                periodicity,
-                phase,
-                k / idivf,
+            terms.append(
+                (
+                    periodicity,
+                    phase.value_in_unit(unit.radian),
+                    k.value_in_unit(unit.kilojoule_per_mole) / idivf,
+                )
+            )
+        return terms
+
+    def _assign_torsion(
+        self, atom_indices, torsion_match, torsions_to_add, torsion_terms_cache=None
+    ):
+
+        torsion_params = torsion_match.parameter_type
+
+        if torsion_terms_cache is None:
+            torsion_terms_cache = dict()
+        terms = torsion_terms_cache.get(torsion_params)
+        if terms is None:
+            terms = self._get_torsion_terms(torsion_params)
+            torsion_terms_cache[torsion_params] = terms
+
+        for (periodicity, phase, k) in terms:
+            torsions_to_add.append(
+                (
+                    atom_indices[0],
+                    atom_indices[1],
+                    atom_indices[2],
+                    atom_indices[3],
+                    periodicity,
+                    phase,
+                    k,
+                )
             )
 
     def _assign_fractional_bond_orders(
-        self, atom_indices, torsion_match, force, **kwargs
+        self,
+        atom_indices,
+        torsion_match,
+        torsions_to_add,
+        interpolated_terms_cache=None,
+        **kwargs,
     ):
         from openforcefield.utils.toolkits import GLOBAL_TOOLKIT_REGISTRY
 
         torsion_params = torsion_match.parameter_type
         match = torsion_match.environment_match
 
-        for (periodicity, phase, k_bondorder, idivf) in zip(
-            torsion_params.periodicity,
-            torsion_params.phase,
-            torsion_params.k_bondorder,
-            torsion_params.idivf,
-        ):
+        if interpolated_terms_cache is None:
+            interpolated_terms_cache = dict()
+
+        # get central bond for reference molecule
+        central_bond = match.reference_molecule.get_bond_between(
+            match.reference_atom_indices[1], match.reference_atom_indices[2]
+        )
+
+        # The interpolated terms only depend on the parameter type and on the
+        # fractional bond order, so they are computed and validated once for all
+        # copies of a molecule (and all torsions around equivalent bonds).
+        terms = None
+        if central_bond.fractional_bond_order is not None:
+            terms = interpolated_terms_cache.get(
+                (torsion_params, central_bond.fractional_bond_order)
+            )
+        if terms is None:
+            terms = self._get_interpolated_torsion_terms(
+                torsion_params,
+                match.reference_molecule,
+                central_bond,
+                kwargs.get("toolkit_registry", GLOBAL_TOOLKIT_REGISTRY),
+            )
+            interpolated_terms_cache[
+                (torsion_params, central_bond.fractional_bond_order)
+            ] = terms
+
+        for (periodicity, phase, k) in terms:
+            # add a torsion with given parameters for topology atoms
+            torsions_to_add.append(
+                (
+                    atom_indices[0],
+                    atom_indices[1],
+                    atom_indices[2],
+                    atom_indices[3],
+                    periodicity,
+                    phase,
+                    k,
+                )
+            )
+
+    def _get_interpolated_torsion_terms(
+        self, torsion_params, reference_molecule, central_bond, toolkit_registry
+    ):
+        """Interpolate the terms of a torsion type on the fractional bond order of its central bond.
 
+        Parameters
+        ----------
+        torsion_params : ProperTorsionHandler.ProperTorsionType
+            The torsion type, which must define ``k_bondorder``.
+        reference_molecule : openforcefield.topology.Molecule
+            The reference molecule containing the torsion.
+        central_bond : openforcefield.topology.Bond
+            The central bond of the torsion in ``reference_molecule``. If its
+            fractional bond order is not set, the fractional bond orders of the
+            whole reference molecule are assigned.
+        toolkit_registry : openforcefield.utils.toolkits.ToolkitRegistry or openforcefield.utils.toolkits.ToolkitWrapper
+            The toolkit used to assign the fractional bond orders.
+
+        Returns
+        -------
+        terms : list of tuple
+            A ``(periodicity, phase, k / idivf)`` tuple for each term, with the phase
+            in radians and the force constant in kJ/mol, as expected by OpenMM.
+        """
+        for k_bondorder, idivf in zip(torsion_params.k_bondorder, torsion_params.idivf):
             if len(k_bondorder) < 2:
                 raise ValueError(
                     "At least 2 bond order values required for `k_bondorder`; "
@@ -3191,31 +3578,29 @@ class ProperTorsionHandler(ParameterHandler):
                     "support for the torsion `idivf` value of 'auto'"
                 )
 
-            # get central bond for reference molecule
-            central_bond = match.reference_molecule.get_bond_between(
-                match.reference_atom_indices[1], match.reference_atom_indices[2]
+        # if fractional bond order not calculated yet, we calculate it
+        # should only happen once per reference molecule for which we care
+        # about fractional bond interpolation
+        # and not at all for reference molecules we don't
+        if central_bond.fractional_bond_order is None and torsion_params.k_bondorder:
+            reference_molecule.assign_fractional_bond_orders(
+                toolkit_registry=toolkit_registry,
+                use_conformers=reference_molecule.conformers,
+                bond_order_model=self.fractional_bondorder_method.lower(),
             )
+        fractional_bond_order = central_bond.fractional_bond_order
 
-            # if fractional bond order not calculated yet, we calculate it
-            # should only happen once per reference molecule for which we care
-            # about fractional bond interpolation
-            # and not at all for reference molecules we don't
-            if central_bond.fractional_bond_order is None:
-                toolkit_registry = kwargs.get(
-                    "toolkit_registry", GLOBAL_TOOLKIT_REGISTRY
-                )
-                match.reference_molecule.assign_fractional_bond_orders(
-                    toolkit_registry=toolkit_registry,
-                    use_conformers=match.reference_molecule.conformers,
-                    bond_order_model=self.fractional_bondorder_method.lower(),
-                )
-
+        terms = []
+        for (periodicity, phase, k_bondorder, idivf) in zip(
+            torsion_params.periodicity,
+            torsion_params.phase,
+            torsion_params.k_bondorder,
+            torsion_params.idivf,
+        ):
             # scale k based on the bondorder of the central bond
             if self.fractional_bondorder_interpolation == "linear":
                 # we only interpolate on k
-                k = _linear_inter_or_extrapolate(
-                    k_bondorder, central_bond.fractional_bond_order
-                )
+                k = _linear_inter_or_extrapolate(k_bondorder, fractional_bond_order)
             else:
                 # TODO: This code is effectively unreachable due to the the _allow_only converter used in this
                 #       ParameterAttribute's definition, which only allows "linear". Remove?
@@ -3225,16 +3610,15 @@ class ProperTorsionHandler(ParameterHandler):
                     )
                 )
 
-            # add a torsion with given parameters for topology atoms
-            force.addTorsion(
-                atom_indices[0],
-                atom_indices[1],
-                atom_indices[2],
-                atom_indices[3],
-                periodicity,
-                phase,
-                k / idivf,
+            # Strip the units in the form expected by OpenMM.
+            terms.append(
+                (
+                    periodicity,
+                    phase.value_in_unit(unit.radian),
+                    k.value_in_unit(unit.kilojoule_per_mole) / idivf,
+                )
             )
+        return terms
 
 
 # TODO: There's a lot of duplicated code in ProperTorsionHandler and ImproperTorsionHandler
@@ -3262,6 +3646,9 @@ class ImproperTorsionHandler(ParameterHandler):
     _INFOTYPE = ImproperTorsionType  # info type to store
     _OPENMMTYPE = openmm.PeriodicTorsionForce  # OpenMM force class to create
 
+    # ((0, 1, 2), (1, 2, 0), and (2, 0, 1)) are the three paths around the trefoil
+    _TREFOIL_PERMUTATIONS = ((0, 1, 2), (1, 2, 0), (2, 0, 1))
+
     potential = ParameterAttribute(
         default="k*(1+cos(periodicity*theta-phase))",
         converter=_allow_only(["k*(1+cos(periodicity*theta-phase))"]),
@@ -3313,19 +3700,63 @@ class ImproperTorsionHandler(ParameterHandler):
         """
         return self._find_matches(entity, transformed_dict_cls=ImproperDict)
 
+    @staticmethod
+    def _get_improper_terms(improper):
+        """Convert the terms of an improper torsion type into plain floats.
+
+        Parameters
+        ----------
+        improper : ImproperTorsionHandler.ImproperTorsionType
+            The improper torsion type.
+
+        Returns
+        -------
+        terms : list of tuple
+            A ``(periodicity, phase, k / idivf)`` tuple for each term, with the phase
+            in radians and the force constant in kJ/mol, as expected by OpenMM.
+        """
+        # TODO: This is a lazy hack. idivf should be set according to the ParameterHandler's default_idivf attrib
+        if improper.idivf is None:
+            improper.idivf = [3 for item in improper.k]
+
+        terms = []
+        for (
+            improper_periodicity,
+            improper_phase,
+            improper_k,
+            improper_idivf,
+        ) in zip(improper.periodicity, improper.phase, improper.k, improper.idivf):
+            # TODO: Implement correct "auto" behavior
+            if improper_idivf == "auto":
+                improper_idivf = 3
+                logger.warning(
+                    "The OpenForceField toolkit hasn't implemented "
+                    "support for the torsion `idivf` value of 'auto'."
+                    "Currently assuming a value of '3' for impropers."
+                )
+            terms.append(
+                (
+                    improper_periodicity,
+                    improper_phase.value_in_unit(unit.radian),
+                    improper_k.value_in_unit(unit.kilojoule_per_mole) / improper_idivf,
+                )
+            )
+        return terms
+
     def create_force(self, system, topology, **kwargs):
         # force = super(ImproperTorsionHandler, self).create_force(system, topology, **kwargs)
         # force = super().create_force(system, topology, **kwargs)
-        existing = [system.getForce(i) for i in range(system.getNumForces())]
-        existing = [f for f in existing if type(f) == openmm.PeriodicTorsionForce]
-        if len(existing) == 0:
-            force = openmm.PeriodicTorsionForce()
-            system.addForce(force)
-        else:
-            force = existing[0]
+        force = _get_force(system, self._OPENMMTYPE)
+        if force is None:
+            force = self._OPENMMTYPE()
+            _add_force(system, force)
 
         # Add all improper torsions to the system
         improper_matches = self.find_matches(topology)
+        # Torsion terms are collected first and added to the force in one pass.
+        torsions_to_add = []
+        # The unitless terms of each improper type, converted on first use.
+        improper_terms_cache = dict()
         for (atom_indices, improper_match) in improper_matches.items():
             # Ensure atoms are actually bonded correct pattern in Topology
             # For impropers, central atom is atom 1
@@ -3334,42 +3765,37 @@ class ImproperTorsionHandler(ParameterHandler):
             self._assert_correct_connectivity(improper_match, [(0, 1), (1, 2), (1, 3)])
 
             improper = improper_match.parameter_type
+            # Permute non-central atoms
+            others = (atom_indices[0], atom_indices[2], atom_indices[3])
+
+            terms = improper_terms_cache.get(improper)
+            if terms is None:
+                terms = self._get_improper_terms(improper)
+                improper_terms_cache[improper] = terms
 
-            # TODO: This is a lazy hack. idivf should be set according to the ParameterHandler's default_idivf attrib
-            if improper.idivf is None:
-                improper.idivf = [3 for item in improper.k]
             # Impropers are applied in three paths around the trefoil having the same handedness
-            for (
-                improper_periodicity,
-                improper_phase,
-                improper_k,
-                improper_idivf,
-            ) in zip(improper.periodicity, improper.phase, improper.k, improper.idivf):
-                # TODO: Implement correct "auto" behavior
-                if improper_idivf == "auto":
-                    improper_idivf = 3
-                    logger.warning(
-                        "The OpenForceField toolkit hasn't implemented "
-                        "support for the torsion `idivf` value of 'auto'."
-                        "Currently assuming a value of '3' for impropers."
-                    )
-                # Permute non-central atoms
-                others = [atom_indices[0], atom_indices[2], atom_indices[3]]
-                # ((0, 1, 2), (1, 2, 0), and (2, 0, 1)) are the three paths around the trefoil
-                for p in [
-                    (others[i], others[j], others[k])
-                    for (i, j, k) in [(0, 1, 2), (1, 2, 0), (2, 0, 1)]
-                ]:
+            for (improper_periodicity, improper_phase, improper_k) in terms:
+                # Note that the three paths are distinct dihedral angles even when the
+                # non-central atoms are chemically equivalent (e.g. the hydrogens of
+                # ammonia), so they cannot be merged into a single term with a larger k.
+                for (i, j, k) in self._TREFOIL_PERMUTATIONS:
                     # The torsion force gets added three times, since the k is divided by three
-                    force.addTorsion(
-                        atom_indices[1],
-                        p[0],
-                        p[1],
-                        p[2],
-                        improper_periodicity,
-                        improper_phase,
-                        improper_k / improper_idivf,
+                    torsions_to_add.append(
+                        (
+                            atom_indices[1],
+                            others[i],
+                            others[j],
+                            others[k],
+                            improper_periodicity,
+                            improper_phase,
+                            improper_k,
+                        )
                     )
+
+        add_torsion = force.addTorsion
+        for torsion_args in torsions_to_add:
+            add_torsion(*torsion_args)
+
         logger.info(
             "{} impropers added, each applied in a six-fold trefoil".format(
                 len(improper_matches)
@@ -3377,6 +3803,14 @@ class ImproperTorsionHandler(ParameterHandler):
         )
 
 
+# Hard-coded nonbonded settings, created once rather than on every create_force call.
+_PME_CUTOFF = 9.0 * unit.angstrom
+_PME_EWALD_ERROR_TOLERANCE = 1.0e-4
+_ZERO_SWITCH_WIDTH = 0.0 * unit.angstrom
+# Largest allowed difference between the partial and formal charge sums of a molecule.
+_NONINTEGRAL_CHARGE_TOLERANCE = 0.01 * unit.elementary_charge
+
+
 class _NonbondedHandler(ParameterHandler):
     """Base class for ParameterHandlers that deal with OpenMM NonbondedForce objects."""
 
@@ -3387,24 +3821,25 @@ class _NonbondedHandler(ParameterHandler):
         # initialize a dict for that here.
         # TODO: This should be an attribute of the _system_, not the _topology_. However, since we're still using
         #  OpenMM's System class, I am storing this data on the OFF Topology until we make an OFF System class.
+        # The dict is keyed by the id of each reference molecule, since hashing a
+        # molecule requires its SMILES. The molecule is kept next to its charge method
+        # so that a stale entry (e.g. in a deep copy of the topology) is never mistaken
+        # for it.
         if not hasattr(topology, "_ref_mol_to_charge_method"):
             topology._ref_mol_to_charge_method = {
-                ref_mol: None for ref_mol in topology.reference_molecules
+                id(ref_mol): (ref_mol, None) for ref_mol in topology.reference_molecules
             }
 
         # Retrieve the system's OpenMM NonbondedForce
-        existing = [system.getForce(i) for i in range(system.getNumForces())]
-        existing = [f for f in existing if type(f) == self._OPENMMTYPE]
+        force = _get_force(system, self._OPENMMTYPE)
 
         # If there isn't yet one, initialize it and populate it with particles
-        if len(existing) == 0:
+        if force is None:
             force = self._OPENMMTYPE()
-            system.addForce(force)
+            _add_force(system, force)
             # Create all particles.
             for _ in topology.topology_particles:
                 force.addParticle(0.0, 1.0, 0.0)
-        else:
-            force = existing[0]
 
         return force
 
@@ -3420,7 +3855,7 @@ class _NonbondedHandler(ParameterHandler):
             The topology to record this information on.
         """
         # TODO: Change this to interface with system object instead of topology once we move away from OMM's System
-        topology._ref_mol_to_charge_method[ref_mol] = self.__class__
+        topology._ref_mol_to_charge_method[id(ref_mol)] = (ref_mol, self.__class__)
 
     @staticmethod
     def check_charges_assigned(ref_mol, topology):
@@ -3441,7 +3876,35 @@ class _NonbondedHandler(ParameterHandler):
 
         """
         # TODO: Change this to interface with system object instead of topology once we move away from OMM's System
-        return topology._ref_mol_to_charge_method[ref_mol] is not None
+        charge_method = topology._ref_mol_to_charge_method.get(id(ref_mol))
+        return (
+            charge_method is not None
+            and charge_method[0] is ref_mol
+            and charge_method[1] is not None
+        )
+
+    @staticmethod
+    def _set_particle_charges(force, particle_charges):
+        """
+        Set the charges of particles in a NonbondedForce, keeping their other parameters.
+
+        Parameters
+        ----------
+        force : simtk.openmm.NonbondedForce
+            The force to modify.
+        particle_charges : Iterable[Tuple[int, float]]
+            Pairs of topology particle index and charge, in units of elementary
+            charge or as a simtk.unit.Quantity.
+        """
+        get_particle_parameters = force.getParticleParameters
+        set_particle_parameters = force.setParticleParameters
+        for topology_particle_index, particle_charge in particle_charges:
+            # Retrieve nonbonded parameters for the particle (charge not set yet)
+            _, sigma, epsilon = get_particle_parameters(topology_particle_index)
+            # Set the nonbonded force with the partial charge
+            set_particle_parameters(
+                topology_particle_index, particle_charge, sigma, epsilon
+            )
 
 
 class vdWHandler(_NonbondedHandler):
@@ -3475,6 +3938,9 @@ class vdWHandler(_NonbondedHandler):
 
             super().__init__(**kwargs)
 
+    # sigma = 2 * rmin_half / 2^(1/6)
+    _RMIN_HALF_TO_SIGMA = 2.0 / (2.0 ** (1.0 / 6.0))
+
     _TAGNAME = "vdW"  # SMIRNOFF tag name to process
     _INFOTYPE = vdWType  # info type to store
     # _KWARGS = ['ewaldErrorTolerance',
@@ -3568,8 +4034,8 @@ class vdWHandler(_NonbondedHandler):
                 #                             "must be provided")
             else:
                 force.setNonbondedMethod(openmm.NonbondedForce.LJPME)
-                force.setCutoffDistance(9.0 * unit.angstrom)
-                force.setEwaldErrorTolerance(1.0e-4)
+                force.setCutoffDistance(_PME_CUTOFF)
+                force.setEwaldErrorTolerance(_PME_EWALD_ERROR_TOLERANCE)
 
         # If method is cutoff, then we currently support openMM's PME for periodic system and NoCutoff for nonperiodic
         elif self._method == "cutoff":
@@ -3584,19 +4050,30 @@ class vdWHandler(_NonbondedHandler):
         # Iterate over all defined Lennard-Jones types, allowing later matches to override earlier ones.
         atom_matches = self.find_matches(topology)
 
-        # Set the particle Lennard-Jones terms.
+        # Set the particle Lennard-Jones terms. The sigma and epsilon of each
+        # type are converted once to plain floats in the units expected by OpenMM.
+        lj_params_by_type = dict()
+        set_particle_parameters = force.setParticleParameters
         for atom_key, atom_match in atom_matches.items():
-            atom_idx = atom_key[0]
             ljtype = atom_match.parameter_type
-            if ljtype.sigma is None:
-                sigma = 2.0 * ljtype.rmin_half / (2.0 ** (1.0 / 6.0))
-            else:
-                sigma = ljtype.sigma
-            force.setParticleParameters(atom_idx, 0.0, sigma, ljtype.epsilon)
+            lj_params = lj_params_by_type.get(ljtype)
+            if lj_params is None:
+                if ljtype.sigma is None:
+                    sigma = ljtype.rmin_half * self._RMIN_HALF_TO_SIGMA
+                else:
+                    sigma = ljtype.sigma
+                lj_params = (
+                    sigma.value_in_unit(unit.nanometer),
+                    ljtype.epsilon.value_in_unit(unit.kilojoule_per_mole),
+                )
+                lj_params_by_type[ljtype] = lj_params
+            set_particle_parameters(atom_key[0], 0.0, *lj_params)
 
         # Check that no atoms (n.b. not particles) are missing force parameters.
         self._check_all_valence_terms_assigned(
-            assigned_terms=atom_matches, valence_terms=list(topology.topology_atoms)
+            assigned_terms=atom_matches,
+            valence_terms=topology.topology_atoms,
+            n_valence_terms=topology.n_topology_atoms,
         )
 
     # TODO: Can we express separate constraints for postprocessing and normal processing?
@@ -3604,25 +4081,44 @@ class vdWHandler(_NonbondedHandler):
         # Create exceptions based on bonds.
         # TODO: This postprocessing must occur after the ChargeIncrementModelHandler
         # QUESTION: Will we want to do this for *all* cases, or would we ever want flexibility here?
-        bond_particle_indices = []
+        # The atom index pairs of the bonds in each reference molecule are
+        # collected once, and mapped to topology indices for each topology molecule.
+        ref_bond_pairs_by_ref_mol = dict()
+        top_bond_pairs = []
 
         for topology_molecule in topology.topology_molecules:
 
             top_mol_particle_start_index = topology_molecule.atom_start_topology_index
 
-            for topology_bond in topology_molecule.bonds:
-
-                top_index_1 = topology_molecule._ref_to_top_index[
-                    topology_bond.bond.atom1_index
-                ]
-                top_index_2 = topology_molecule._ref_to_top_index[
-                    topology_bond.bond.atom2_index
-                ]
+            reference_molecule = topology_molecule.reference_molecule
+            ref_bond_pairs = ref_bond_pairs_by_ref_mol.get(id(reference_molecule))
+            if ref_bond_pairs is None:
+                ref_bond_pairs = np.array(
+                    [
+                        (bond.atom1_index, bond.atom2_index)
+                        for bond in reference_molecule.bonds
+                    ],
+                    dtype=np.int64,
+                ).reshape(-1, 2)
+                ref_bond_pairs_by_ref_mol[id(reference_molecule)] = ref_bond_pairs
+
+            ref_to_top_index = topology_molecule._ref_to_top_index
+            ref_to_top_index_array = np.empty(len(ref_to_top_index), dtype=np.int64)
+            ref_to_top_index_array[list(ref_to_top_index.keys())] = list(
+                ref_to_top_index.values()
+            )
 
-                top_index_1 += top_mol_particle_start_index
-                top_index_2 += top_mol_particle_start_index
+            top_bond_pairs.append(
+                ref_to_top_index_array[ref_bond_pairs] + top_mol_particle_start_index
+            )
 
-                bond_particle_indices.append((top_index_1, top_index_2))
+        # Convert the pairs to the tuples OpenMM expects in a single pass.
+        if len(top_bond_pairs) > 0:
+            bond_particle_indices = list(
+                map(tuple, np.concatenate(top_bond_pairs).tolist())
+            )
+        else:
+            bond_particle_indices = []
 
         for force in system.getForces():
             # TODO: Should we just store which `Force` object we are adding to and use that instead,
@@ -3688,7 +4184,7 @@ class ElectrostaticsHandler(_NonbondedHandler):
 
     @switch_width.converter
     def switch_width(self, attr, new_switch_width):
-        if self._switch_width != 0.0 * unit.angstrom:
+        if self._switch_width != _ZERO_SWITCH_WIDTH:
             raise IncompatibleParameterError(
                 "The current implementation of the Open Force Field toolkit can not "
                 "support an electrostatic switching width. Currently only `0.0 angstroms` "
@@ -3741,47 +4237,57 @@ class ElectrostaticsHandler(_NonbondedHandler):
             Whether a match was found. If True, the input molecule will have been modified in-place.
         """
 
-        import simtk.unit
+        # Like Topology.add_molecule, use canonical SMILES as a cheap prefilter, so that the
+        # expensive isomorphism check is only run (to get the atom map) on molecules that can match.
+        # Molecule.to_smiles caches its result, so each charge_mol is only converted once.
+        # Comparing a few graph invariants first avoids generating SMILES for charge_mols
+        # that obviously differ from the input molecule.
+        molecule_invariants = _molecule_invariants(molecule)
+        molecule_smiles = None
 
         # Check each charge_mol for whether it's isomorphic to the input molecule
         for charge_mol in charge_mols:
-            ismorphic, topology_atom_map = Molecule.are_isomorphic(
-                molecule,
-                charge_mol,
-                return_atom_map=True,
-                aromatic_matching=True,
-                formal_charge_matching=True,
-                bond_order_matching=True,
-                atom_stereochemistry_matching=True,
-                bond_stereochemistry_matching=True,
-            )
+            if _molecule_invariants(charge_mol) != molecule_invariants:
+                continue
+            if molecule_smiles is None:
+                molecule_smiles = molecule.to_smiles()
+            if charge_mol.to_smiles() != molecule_smiles:
+                continue
+            topology_atom_map = _stringent_isomorphism_atom_map(molecule, charge_mol)
             # if they are isomorphic then use the mapping
-            if ismorphic:
+            if topology_atom_map is not None:
                 # Take the first valid atom indexing map
                 # Set the partial charges
                 # Make a copy of the charge molecule's charges array (this way it's the right shape)
-                temp_mol_charges = copy.deepcopy(
-                    simtk.unit.Quantity(charge_mol.partial_charges)
+                charge_mol_charges = np.asarray(
+                    charge_mol.partial_charges.value_in_unit(unit.elementary_charge)
+                )
+                temp_mol_charges = charge_mol_charges.copy()
+                charge_idxs = np.fromiter(
+                    topology_atom_map.keys(),
+                    dtype=np.int64,
+                    count=len(topology_atom_map),
                 )
-                for charge_idx, ref_idx in topology_atom_map.items():
-                    temp_mol_charges[ref_idx] = charge_mol.partial_charges[charge_idx]
-                molecule.partial_charges = temp_mol_charges
+                ref_idxs = np.fromiter(
+                    topology_atom_map.values(),
+                    dtype=np.int64,
+                    count=len(topology_atom_map),
+                )
+                temp_mol_charges[ref_idxs] = charge_mol_charges[charge_idxs]
+                molecule.partial_charges = temp_mol_charges * unit.elementary_charge
                 return True
 
         # If no match was found, return False
         return False
 
     def create_force(self, system, topology, **kwargs):
-        from openforcefield.topology import (
-            FrozenMolecule,
-            TopologyAtom,
-            TopologyVirtualSite,
-        )
-
         force = super().create_force(system, topology, **kwargs)
 
         # See if each molecule should have charges assigned by the charge_from_molecules kwarg
-        for ref_mol in topology.reference_molecules:
+        for (
+            ref_mol,
+            topology_molecules,
+        ) in topology._reference_molecule_to_topology_molecules.items():
 
             # If charges were already assigned, skip this molecule
             if self.check_charges_assigned(ref_mol, topology):
@@ -3800,37 +4306,23 @@ class ElectrostaticsHandler(_NonbondedHandler):
 
             # Otherwise, the molecule is in the charge_from_molecules list, and we should assign charges to all
             # instances of it in this topology.
-            for topology_molecule in topology._reference_molecule_to_topology_molecules[
-                ref_mol
-            ]:
+            # Strip the units of the charges once, for all the copies of this molecule.
+            ref_mol_charges = ref_mol._partial_charges.value_in_unit(
+                unit.elementary_charge
+            )
+            particle_charges = []
+            for topology_molecule in topology_molecules:
 
                 for topology_particle in topology_molecule.particles:
 
-                    if type(topology_particle) is TopologyAtom:
-                        ref_mol_particle_index = (
-                            topology_particle.atom.molecule_particle_index
-                        )
-                    elif type(topology_particle) is TopologyVirtualSite:
-                        ref_mol_particle_index = (
-                            topology_particle.virtual_site.molecule_particle_index
-                        )
-                    else:
-                        raise ValueError(
-                            f"Particles of type {type(topology_particle)} are not supported"
-                        )
+                    ref_mol_particle_index = topology_particle.molecule_particle_index
 
                     topology_particle_index = topology_particle.topology_particle_index
 
-                    particle_charge = ref_mol._partial_charges[ref_mol_particle_index]
+                    particle_charge = ref_mol_charges[ref_mol_particle_index]
+                    particle_charges.append((topology_particle_index, particle_charge))
 
-                    # Retrieve nonbonded parameters for reference atom (charge not set yet)
-                    _, sigma, epsilon = force.getParticleParameters(
-                        topology_particle_index
-                    )
-                    # Set the nonbonded force with the partial charge
-                    force.setParticleParameters(
-                        topology_particle_index, particle_charge, sigma, epsilon
-                    )
+            self._set_particle_charges(force, particle_charges)
 
             # Finally, mark that charges were assigned for this reference molecule
             self.mark_charges_assigned(ref_mol, topology)
@@ -3866,9 +4358,13 @@ class ElectrostaticsHandler(_NonbondedHandler):
                     pass
                     # There's no need to check for matching cutoff/tolerance here since both are hard-coded defaults
                 else:
-                    force.setNonbondedMethod(openmm.NonbondedForce.PME)
-                    force.setCutoffDistance(9.0 * unit.angstrom)
-                    force.setEwaldErrorTolerance(1.0e-4)
+                    # Only update the settings that differ from those of the force.
+                    if current_nb_method != openmm.NonbondedForce.PME:
+                        force.setNonbondedMethod(openmm.NonbondedForce.PME)
+                    if force.getCutoffDistance() != _PME_CUTOFF:
+                        force.setCutoffDistance(_PME_CUTOFF)
+                    if force.getEwaldErrorTolerance() != _PME_EWALD_ERROR_TOLERANCE:
+                        force.setEwaldErrorTolerance(_PME_EWALD_ERROR_TOLERANCE)
 
             settings_matched = True
 
@@ -3911,7 +4407,11 @@ class ElectrostaticsHandler(_NonbondedHandler):
             )
 
     def postprocess_system(self, system, topology, **kwargs):
-        force = super().create_force(system, topology, **kwargs)
+        # The NonbondedForce was created and populated by create_force, so it
+        # only needs to be looked up.
+        force = _get_force(system, self._OPENMMTYPE)
+        if force is None:
+            force = super().create_force(system, topology, **kwargs)
         # Check to ensure all molecules have had charges assigned
         uncharged_mols = []
         for ref_mol in topology.reference_molecules:
@@ -3926,27 +4426,37 @@ class ElectrostaticsHandler(_NonbondedHandler):
 
         # Unless check is disabled, ensure that the sum of partial charges on a molecule
         # add up to approximately its formal charge
-        allow_nonintegral_charges = kwargs.get("allow_nonintegral_charges", False)
+        if kwargs.get("allow_nonintegral_charges", False):
+            return
+        # Compare plain floats, and only build Quantities for the error message.
+        # The formal charge is computed once per reference molecule.
+        tolerance = _NONINTEGRAL_CHARGE_TOLERANCE.value_in_unit(unit.elementary_charge)
+        formal_charge_sums = dict()
         for top_mol in topology.topology_molecules:
-            # Skip check if user manually disables it.
-            if allow_nonintegral_charges:
-                continue
-            formal_charge_sum = top_mol.reference_molecule.total_charge
-            partial_charge_sum = 0.0 * unit.elementary_charge
-            for top_particle in top_mol.particles:
-                q, _, _ = force.getParticleParameters(
-                    top_particle.topology_particle_index
+            ref_mol = top_mol.reference_molecule
+            formal_charge_sum = formal_charge_sums.get(id(ref_mol))
+            if formal_charge_sum is None:
+                formal_charge_sum = ref_mol.total_charge.value_in_unit(
+                    unit.elementary_charge
                 )
-                partial_charge_sum += q
-            if (
-                abs(formal_charge_sum - partial_charge_sum)
-                > 0.01 * unit.elementary_charge
-            ):
+                formal_charge_sums[id(ref_mol)] = formal_charge_sum
+            partial_charges = np.fromiter(
+                (
+                    force.getParticleParameters(top_particle.topology_particle_index)[
+                        0
+                    ].value_in_unit(unit.elementary_charge)
+                    for top_particle in top_mol.particles
+                ),
+                dtype=float,
+                count=top_mol.n_particles,
+            )
+            partial_charge_sum = float(partial_charges.sum())
+            if abs(formal_charge_sum - partial_charge_sum) > tolerance:
                 msg = (
-                    f"Partial charge sum ({partial_charge_sum}) "
-                    f"for molecule '{top_mol.reference_molecule.name}' (SMILES "
-                    f"{top_mol.reference_molecule.to_smiles()} does not equal formal charge sum "
-                    f"({formal_charge_sum}). To override this error, provide the "
+                    f"Partial charge sum ({partial_charge_sum * unit.elementary_charge}) "
+                    f"for molecule '{ref_mol.name}' (SMILES "
+                    f"{ref_mol.to_smiles()} does not equal formal charge sum "
+                    f"({formal_charge_sum * unit.elementary_charge}). To override this error, provide the "
                     f"'allow_nonintegral_charges=True' keyword to ForceField.create_openmm_system"
                 )
                 raise NonintegralMoleculeChargeException(msg)
@@ -4005,28 +4515,45 @@ class LibraryChargeHandler(_NonbondedHandler):
         return self._find_matches(entity, transformed_dict_cls=dict)
 
     def create_force(self, system, topology, **kwargs):
-        from openforcefield.topology import FrozenMolecule
-
         force = super().create_force(system, topology, **kwargs)
 
         # Iterate over all defined library charge parameters, allowing later matches to override earlier ones.
         atom_matches = self.find_matches(topology)
 
-        # Create a set of all the topology atom indices for which library charges can be applied
-        assignable_atoms = set()
-        atom_assignments = dict()
+        # Collect the library charge (in elementary charge units) of each topology atom for
+        # which library charges can be applied. NaN marks the atoms without one.
+        atom_assignments = np.full(topology.n_topology_atoms, np.nan)
+        # Flatten the matches into parallel arrays of topology indices and charges. Many matches
+        # share a parameter type, so its charges are only stripped of units once.
+        match_top_indices = []
+        match_charges = []
+        charges_by_parameter_type = dict()
+        for topology_indices, library_charge in atom_matches.items():
+            parameter_type = library_charge.parameter_type
+            charges = charges_by_parameter_type.get(id(parameter_type))
+            if charges is None:
+                charges = tuple(
+                    charge.value_in_unit(unit.elementary_charge)
+                    for charge in parameter_type.charge
+                )
+                charges_by_parameter_type[id(parameter_type)] = charges
+            match_top_indices.extend(topology_indices)
+            match_charges.extend(charges[: len(topology_indices)])
         # TODO: This assumes that later matches should always override earlier ones. This may require more
         #       thought, since matches can be partially overlapping
-        for topology_indices, library_charge in atom_matches.items():
-            for charge_idx, top_idx in enumerate(topology_indices):
-                if top_idx in assignable_atoms:
-                    logger.debug(
-                        f"Multiple library charge assignments found for atom {top_idx}"
-                    )
-                assignable_atoms.add(top_idx)
-                atom_assignments[top_idx] = library_charge.parameter_type.charge[
-                    charge_idx
-                ]
+        if len(match_top_indices) > 0:
+            # Reverse the arrays so that the first occurrence np.unique reports for each atom
+            # is its last match.
+            match_top_indices = np.array(match_top_indices)[::-1]
+            match_charges = np.array(match_charges)[::-1]
+            unique_top_indices, last_match_idxs, n_matches = np.unique(
+                match_top_indices, return_index=True, return_counts=True
+            )
+            for top_idx in unique_top_indices[n_matches > 1]:
+                logger.debug(
+                    f"Multiple library charge assignments found for atom {top_idx}"
+                )
+            atom_assignments[unique_top_indices] = match_charges[last_match_idxs]
         # TODO: Should header include a residue separator delimiter? Maybe not, since it's not clear how having
         #       multiple LibraryChargeHandlers could return a single set of matches while respecting different
         #       separators.
@@ -4044,12 +4571,15 @@ class LibraryChargeHandler(_NonbondedHandler):
             if self.check_charges_assigned(top_mol.reference_molecule, topology):
                 continue
 
-            # Ensure all of the atoms in this mol are covered, otherwise skip it
-            top_particle_idxs = [atom.topology_particle_index for atom in top_mol.atoms]
-            if (
-                len(set(top_particle_idxs).intersection(assignable_atoms))
-                != top_mol.n_atoms
-            ):
+            # Ensure all of the atoms in this mol are covered, otherwise skip it.
+            # The atoms of a topology molecule have contiguous topology indices.
+            top_mol_atom_start_index = top_mol.atom_start_topology_index
+            top_particle_idxs = range(
+                top_mol_atom_start_index, top_mol_atom_start_index + top_mol.n_atoms
+            )
+            if np.isnan(
+                atom_assignments[top_particle_idxs.start : top_particle_idxs.stop]
+            ).any():
                 logger.debug(
                     "Entire molecule is not covered. Skipping library charge assignment."
                 )
@@ -4058,11 +4588,13 @@ class LibraryChargeHandler(_NonbondedHandler):
             # If we pass both tests above, go ahead and assign charges
             # TODO: We could probably save a little time by looking up this TopologyMolecule's _reference molecule_
             #       and assigning charges to all other instances of it in this topology
-            for top_particle_idx in top_particle_idxs:
-                _, sigma, epsilon = force.getParticleParameters(top_particle_idx)
-                force.setParticleParameters(
-                    top_particle_idx, atom_assignments[top_particle_idx], sigma, epsilon
-                )
+            self._set_particle_charges(
+                force,
+                (
+                    (top_particle_idx, atom_assignments[top_particle_idx])
+                    for top_particle_idx in top_particle_idxs
+                ),
+            )
 
             ref_mols_assigned.add(top_mol.reference_molecule)
 
@@ -4071,6 +4603,87 @@ class LibraryChargeHandler(_NonbondedHandler):
             self.mark_charges_assigned(assigned_mol, topology)
 
 
+def _compute_charges_for_molecules(
+    uncharged_molecules, compute_charges, n_processes=1, **kwargs
+):
+    """Assign partial charges to reference molecules, in several processes if requested.
+
+    Parameters
+    ----------
+    uncharged_molecules : list of (Molecule, list of TopologyMolecule)
+        The reference molecules to charge, with their copies in the topology.
+    compute_charges : callable
+        Module-level function called as ``compute_charges(ref_mol, **kwargs)`` that
+        assigns partial charges to ``ref_mol`` and returns it.
+    n_processes : int or None, optional, default=1
+        The maximum number of processes used to compute charges. If None,
+        ``os.cpu_count()`` processes are used.
+
+    Returns
+    -------
+    charged_molecules : list of (Molecule, list of TopologyMolecule)
+        The entries of ``uncharged_molecules`` whose charges could be computed. A
+        warning is raised for every molecule that failed. The molecules are left in
+        the same state whether or not they were charged in worker processes.
+    """
+    import warnings
+
+    if n_processes is None:
+        n_processes = os.cpu_count()
+    if not isinstance(n_processes, int) or n_processes < 1:
+        raise ValueError(
+            f"n_processes must be a positive integer or None, not {n_processes!r}"
+        )
+
+    if n_processes > 1 and len(uncharged_molecules) > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=min(n_processes, len(uncharged_molecules))
+        )
+        futures = [
+            executor.submit(compute_charges, ref_mol, **kwargs)
+            for ref_mol, _ in uncharged_molecules
+        ]
+        charged_molecule_getters = [future.result for future in futures]
+    else:
+        executor = None
+        charged_molecule_getters = [
+            functools.partial(compute_charges, ref_mol, **kwargs)
+            for ref_mol, _ in uncharged_molecules
+        ]
+
+    charged_molecules = []
+    try:
+        for (ref_mol, topology_molecules), get_charged_molecule in zip(
+            uncharged_molecules, charged_molecule_getters
+        ):
+            try:
+                charged_molecule = get_charged_molecule()
+            except Exception as e:
+                warnings.warn(str(e), Warning)
+                continue
+            # Worker processes charge a copy, so bring back everything that
+            # compute_charges may have changed.
+            if charged_molecule is not ref_mol:
+                ref_mol._conformers = charged_molecule._conformers
+                ref_mol.partial_charges = charged_molecule.partial_charges
+            charged_molecules.append((ref_mol, topology_molecules))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return charged_molecules
+
+
+def _compute_partial_charges_am1bcc(molecule, toolkit_registry):
+    """Assign AM1-BCC partial charges to the molecule and return it.
+
+    This is a module-level function so that it can be run in worker processes.
+    """
+    # We don't need to generate conformers here, since that will be done by default in
+    # compute_partial_charges_am1bcc if the use_conformers kwarg isn't defined
+    molecule.compute_partial_charges_am1bcc(toolkit_registry=toolkit_registry)
+    return molecule
+
+
 class ToolkitAM1BCCHandler(_NonbondedHandler):
     """Handle SMIRNOFF ``<ToolkitAM1BCC>`` tags
 
@@ -4079,7 +4692,10 @@ class ToolkitAM1BCCHandler(_NonbondedHandler):
 
     _TAGNAME = "ToolkitAM1BCC"  # SMIRNOFF tag name to process
     _DEPENDENCIES = [vdWHandler, ElectrostaticsHandler, LibraryChargeHandler]
-    _KWARGS = ["toolkit_registry"]  # Kwargs to catch when create_force is called
+    _KWARGS = [
+        "toolkit_registry",
+        "n_processes",
+    ]  # Kwargs to catch when create_force is called
 
     def check_handler_compatibility(
         self, other_handler, assume_missing_is_default=True
@@ -4100,72 +4716,101 @@ class ToolkitAM1BCCHandler(_NonbondedHandler):
         pass
 
     def create_force(self, system, topology, **kwargs):
-        import warnings
-
-        from openforcefield.topology import (
-            FrozenMolecule,
-            TopologyAtom,
-            TopologyVirtualSite,
-        )
         from openforcefield.utils.toolkits import GLOBAL_TOOLKIT_REGISTRY
 
         force = super().create_force(system, topology, **kwargs)
 
-        for ref_mol in topology.reference_molecules:
-
-            # If charges were already assigned, skip this molecule
-            if self.check_charges_assigned(ref_mol, topology):
-                continue
-
-            # If the molecule wasn't already assigned charge values, calculate them here
-            toolkit_registry = kwargs.get("toolkit_registry", GLOBAL_TOOLKIT_REGISTRY)
-            try:
-                # We don't need to generate conformers here, since that will be done by default in
-                # compute_partial_charges_am1bcc if the use_conformers kwarg isn't defined
-                ref_mol.compute_partial_charges_am1bcc(
-                    toolkit_registry=toolkit_registry
-                )
-            except Exception as e:
-                warnings.warn(str(e), Warning)
-                continue
+        # If charges were already assigned, skip this molecule
+        uncharged_molecules = [
+            (ref_mol, topology_molecules)
+            for (
+                ref_mol,
+                topology_molecules,
+            ) in topology._reference_molecule_to_topology_molecules.items()
+            if not self.check_charges_assigned(ref_mol, topology)
+        ]
 
-            # Assign charges to relevant atoms
-            for topology_molecule in topology._reference_molecule_to_topology_molecules[
-                ref_mol
-            ]:
-                for topology_particle in topology_molecule.atoms:
-                    if type(topology_particle) is TopologyAtom:
-                        ref_mol_particle_index = (
-                            topology_particle.atom.molecule_particle_index
-                        )
-                    elif type(topology_particle) is TopologyVirtualSite:
-                        ref_mol_particle_index = (
-                            topology_particle.virtual_site.molecule_particle_index
-                        )
-                    else:
-                        raise ValueError(
-                            f"Particles of type {type(topology_particle)} are not supported"
-                        )
+        # If the molecule wasn't already assigned charge values, calculate them here.
+        # The charges of distinct molecules are independent, so they can be computed
+        # in several processes if requested.
+        charged_molecules = _compute_charges_for_molecules(
+            uncharged_molecules,
+            _compute_partial_charges_am1bcc,
+            n_processes=kwargs.get("n_processes", 1),
+            toolkit_registry=kwargs.get("toolkit_registry", GLOBAL_TOOLKIT_REGISTRY),
+        )
 
-                    topology_particle_index = topology_particle.topology_particle_index
+        for ref_mol, topology_molecules in charged_molecules:
 
-                    particle_charge = ref_mol._partial_charges[ref_mol_particle_index]
+            # Strip the units of the charges once, for all the copies of this molecule.
+            ref_mol_charges = ref_mol._partial_charges.value_in_unit(
+                unit.elementary_charge
+            )
 
-                    # Retrieve nonbonded parameters for reference atom (charge not set yet)
-                    _, sigma, epsilon = force.getParticleParameters(
-                        topology_particle_index
-                    )
-                    # Set the nonbonded force with the partial charge
-                    force.setParticleParameters(
-                        topology_particle_index, particle_charge, sigma, epsilon
-                    )
+            # Assign charges to relevant atoms. Only atoms are charged here, and
+            # atoms precede virtual sites in the particles of a molecule, so the
+            # index of the reference atom is also its particle index.
+            for topology_molecule in topology_molecules:
+                atom_start_topology_index = topology_molecule.atom_start_topology_index
+                self._set_particle_charges(
+                    force,
+                    (
+                        (
+                            atom_start_topology_index + top_mol_atom_index,
+                            ref_mol_charges[ref_mol_particle_index],
+                        )
+                        for (
+                            ref_mol_particle_index,
+                            top_mol_atom_index,
+                        ) in topology_molecule._ref_to_top_index.items()
+                    ),
+                )
             # Finally, mark that charges were assigned for this reference molecule
             self.mark_charges_assigned(ref_mol, topology)
 
     # TODO: Move chargeModel and library residue charges to SMIRNOFF spec
     def postprocess_system(self, system, topology, **kwargs):
 
+        # <ToolkitAM1BCC> sections normally define no parameters, in which case there are
+        # no bond charge increments to apply and no need to search the topology.
+        if len(self._parameters) == 0:
+            return
+
+        # create_force does not search for matches, so this is the only matching pass
+        # of this handler.
         bond_matches = self.find_matches(topology)
+        if len(bond_matches) == 0:
+            return
+
+        # Sum the bond charge increments of each particle as plain floats, so that the
+        # parameters of each particle are read and written only once per force. The
+        # keys of the matches are sorted, so the direction of each increment is taken
+        # from the order of the tagged atoms instead.
+        bond_particle_indices = np.array(
+            [
+                bond_match.environment_match.topology_atom_indices
+                for bond_match in bond_matches.values()
+            ],
+            dtype=np.int64,
+        )
+        bond_increments = np.array(
+            [
+                bond_match.parameter_type.increment.value_in_unit(
+                    unit.elementary_charge
+                )
+                for bond_match in bond_matches.values()
+            ]
+        )
+        particle_indices, bond_particle_positions = np.unique(
+            bond_particle_indices, return_inverse=True
+        )
+        bond_particle_positions = bond_particle_positions.reshape(-1, 2)
+        particle_increments = np.zeros(len(particle_indices))
+        np.add.at(particle_increments, bond_particle_positions[:, 0], -bond_increments)
+        np.add.at(particle_increments, bond_particle_positions[:, 1], bond_increments)
+        charge_increments = list(
+            zip(particle_indices.tolist(), particle_increments.tolist())
+        )
 
         # Apply bond charge increments to all appropriate force groups
         # QUESTION: Should we instead apply this to the Topology in a preprocessing step, prior to spreading out charge onto virtual sites?
@@ -4173,31 +4818,39 @@ class ToolkitAM1BCCHandler(_NonbondedHandler):
             if force.__class__.__name__ in [
                 "NonbondedForce"
             ]:  # TODO: We need to apply this to all Force types that involve charges, such as (Custom)GBSA forces and CustomNonbondedForce
-                for (atoms, bond_match) in bond_matches.items():
-                    # Get corresponding particle indices in Topology
-                    bond = bond_match.parameter_type
-
-                    particle_indices = tuple([atom.particle_index for atom in atoms])
+                for particle_index, charge_increment in charge_increments:
                     # Retrieve parameters
-                    [charge0, sigma0, epsilon0] = force.getParticleParameters(
-                        particle_indices[0]
-                    )
-                    [charge1, sigma1, epsilon1] = force.getParticleParameters(
-                        particle_indices[1]
-                    )
-                    # Apply bond charge increment
-                    charge0 -= bond.increment
-                    charge1 += bond.increment
-                    # Update charges
-                    force.setParticleParameters(
-                        particle_indices[0], charge0, sigma0, epsilon0
-                    )
-                    force.setParticleParameters(
-                        particle_indices[1], charge1, sigma1, epsilon1
+                    charge, sigma, epsilon = force.getParticleParameters(particle_index)
+                    # Apply bond charge increment and update charges
+                    charge = (
+                        charge.value_in_unit(unit.elementary_charge) + charge_increment
                     )
+                    force.setParticleParameters(particle_index, charge, sigma, epsilon)
                     # TODO: Calculate exceptions
 
 
+def _compute_partial_charges(
+    molecule,
+    partial_charge_method,
+    n_conformers,
+    force_regenerate_conformers,
+    toolkit_registry,
+):
+    """Assign partial charges to the molecule with the given method and return it.
+
+    Conformer generation is expensive, so it is skipped if the molecule already has
+    enough conformers, unless ``force_regenerate_conformers`` is True. This is a
+    module-level function so that it can be run in worker processes.
+    """
+    if force_regenerate_conformers or molecule.n_conformers < n_conformers:
+        molecule.generate_conformers(n_conformers=n_conformers)
+    molecule.assign_partial_charges(
+        partial_charge_method=partial_charge_method,
+        toolkit_registry=toolkit_registry,
+    )
+    return molecule
+
+
 class ChargeIncrementModelHandler(_NonbondedHandler):
     """Handle SMIRNOFF ``<ChargeIncrementModel>`` tags
 
@@ -4242,6 +4895,11 @@ class ChargeIncrementModelHandler(_NonbondedHandler):
         ToolkitAM1BCCHandler,
     ]
     _MAX_SUPPORTED_SECTION_VERSION = 0.4
+    _KWARGS = [
+        "toolkit_registry",
+        "force_regenerate_conformers",
+        "n_processes",
+    ]  # Kwargs to catch when create_force is called
 
     number_of_conformers = ParameterAttribute(default=1, converter=int)
 
@@ -4293,107 +4951,151 @@ class ChargeIncrementModelHandler(_NonbondedHandler):
         return matches
 
     def create_force(self, system, topology, **kwargs):
-        import warnings
-
-        from openforcefield.topology import (
-            FrozenMolecule,
-            TopologyAtom,
-            TopologyVirtualSite,
-        )
-
         # We only want one instance of this force type
-        existing = [system.getForce(i) for i in range(system.getNumForces())]
-        existing = [f for f in existing if type(f) == self._OPENMMTYPE]
-        if len(existing) == 0:
+        force = _get_force(system, self._OPENMMTYPE)
+        if force is None:
             force = self._OPENMMTYPE()
-            system.addForce(force)
-        else:
-            force = existing[0]
-
-        for ref_mol in topology.reference_molecules:
-
-            # If charges were already assigned, skip this molecule
-            if self.check_charges_assigned(ref_mol, topology):
-                continue
+            _add_force(system, force)
+
+        # The charge increment matches of each reference molecule, found on first use.
+        charge_increment_matches_by_ref_mol = None
+        # The charge increments (in elementary charge units) applied by each parameter
+        # type, keyed by the id of the parameter type and the number of tagged atoms.
+        charge_increments_cache = dict()
+        # The charges of the topology particles, in elementary charge units.
+        particle_charges = np.zeros(topology.n_topology_particles)
+
+        # If charges were already assigned, skip this molecule
+        uncharged_molecules = [
+            (ref_mol, topology_molecules)
+            for (
+                ref_mol,
+                topology_molecules,
+            ) in topology._reference_molecule_to_topology_molecules.items()
+            if not self.check_charges_assigned(ref_mol, topology)
+        ]
 
-            toolkit_registry = kwargs.get("toolkit_registry", GLOBAL_TOOLKIT_REGISTRY)
-            try:
-                # If the molecule wasn't assigned parameters from a manually-input charge_mol, calculate them here
-                ref_mol.generate_conformers(n_conformers=self.number_of_conformers)
-                ref_mol.assign_partial_charges(
-                    partial_charge_method=self.partial_charge_method,
-                    toolkit_registry=toolkit_registry,
-                )
-            except Exception as e:
-                warnings.warn(str(e), Warning)
-                continue
+        # If the molecule wasn't assigned parameters from a manually-input charge_mol, calculate them here.
+        # The charges of distinct molecules are independent, so they can be computed
+        # in several processes if requested.
+        charged_molecules = _compute_charges_for_molecules(
+            uncharged_molecules,
+            _compute_partial_charges,
+            n_processes=kwargs.get("n_processes", 1),
+            partial_charge_method=self.partial_charge_method,
+            n_conformers=self.number_of_conformers,
+            force_regenerate_conformers=kwargs.get(
+                "force_regenerate_conformers", False
+            ),
+            toolkit_registry=kwargs.get("toolkit_registry", GLOBAL_TOOLKIT_REGISTRY),
+        )
 
-            charges_to_assign = {}
+        for ref_mol, topology_molecules in charged_molecules:
 
             # Assign initial, un-incremented charges to relevant atoms
-            for topology_molecule in topology._reference_molecule_to_topology_molecules[
-                ref_mol
-            ]:
-                for topology_particle in topology_molecule.particles:
-                    topology_particle_index = topology_particle.topology_particle_index
-                    if type(topology_particle) is TopologyAtom:
-                        ref_mol_particle_index = (
-                            topology_particle.atom.molecule_particle_index
+            top_particle_idxs = []
+            ref_mol_particle_idxs = []
+            for topology_molecule in topology_molecules:
+                # The topology index of each atom follows from its reference atom index,
+                # so atoms are handled without building a TopologyAtom for each of them.
+                atom_start_topology_index = topology_molecule.atom_start_topology_index
+                for (
+                    ref_mol_atom_index,
+                    top_mol_atom_index,
+                ) in topology_molecule._ref_to_top_index.items():
+                    top_particle_idxs.append(
+                        atom_start_topology_index + top_mol_atom_index
+                    )
+                    ref_mol_particle_idxs.append(ref_mol_atom_index)
+                for topology_virtual_site in topology_molecule.virtual_sites:
+                    virtual_particles = topology_virtual_site.virtual_site.particles
+                    for virtual_particle in virtual_particles:
+                        topology_particle = TopologyVirtualParticle(
+                            topology_virtual_site, virtual_particle, topology_molecule
                         )
-                    if type(topology_particle) is TopologyVirtualSite:
-                        ref_mol_particle_index = (
-                            topology_particle.virtual_site.molecule_particle_index
+                        top_particle_idxs.append(
+                            topology_particle.topology_particle_index
                         )
-                    particle_charge = ref_mol._partial_charges[ref_mol_particle_index]
-                    charges_to_assign[topology_particle_index] = particle_charge
-
-            # Find SMARTS-based matches for charge increments
-            charge_increment_matches = self.find_matches(topology)
-
-            # We ignore the atom index order in the keys here, since they have been
-            # sorted in order to deduplicate matches and let us identify when one parameter overwrites another
-            # in the SMIRNOFF parameter hierarchy. Since they are sorted, the position of the atom index
-            # in the key tuple DOES NOT correspond to the appropriate charge_incrementX value.
-            # Instead, the correct ordering of the match indices is found in
-            # charge_increment_match.environment_match.topology_atom_indices
-            for (_, charge_increment_match) in charge_increment_matches.items():
-                # Adjust the values in the charges_to_assign dict by adding any
-                # charge increments onto the existing values
+                        ref_mol_particle_idxs.append(
+                            topology_particle.molecule_particle_index
+                        )
+            top_particle_idxs = np.array(top_particle_idxs, dtype=np.int64)
+            ref_mol_charges = np.asarray(
+                ref_mol._partial_charges.value_in_unit(unit.elementary_charge)
+            )
+            particle_charges[top_particle_idxs] = ref_mol_charges[ref_mol_particle_idxs]
+
+            # Find SMARTS-based matches for charge increments. The topology is matched
+            # once per reference molecule and the matches are unrolled over its copies,
+            # so group them by reference molecule to only visit the matches of this one.
+            if charge_increment_matches_by_ref_mol is None:
+                charge_increment_matches_by_ref_mol = defaultdict(list)
+                # We ignore the atom index order in the keys here, since they have been
+                # sorted in order to deduplicate matches and let us identify when one parameter overwrites another
+                # in the SMIRNOFF parameter hierarchy. Since they are sorted, the position of the atom index
+                # in the key tuple DOES NOT correspond to the appropriate charge_incrementX value.
+                # Instead, the correct ordering of the match indices is found in
+                # charge_increment_match.environment_match.topology_atom_indices
+                for charge_increment_match in self.find_matches(topology).values():
+                    match_ref_mol = (
+                        charge_increment_match.environment_match.reference_molecule
+                    )
+                    charge_increment_matches_by_ref_mol[id(match_ref_mol)].append(
+                        charge_increment_match
+                    )
+
+            # Collect the charge increments of all the matches, and add them onto the
+            # initial charges at once.
+            increment_particle_idxs = []
+            increments = []
+            for charge_increment_match in charge_increment_matches_by_ref_mol.get(
+                id(ref_mol), []
+            ):
                 atom_indices = (
                     charge_increment_match.environment_match.topology_atom_indices
                 )
-                charge_increments = copy.deepcopy(
-                    charge_increment_match.parameter_type.charge_increment
-                )
+                parameter_type = charge_increment_match.parameter_type
+                cache_key = (id(parameter_type), len(atom_indices))
+                charge_increments = charge_increments_cache.get(cache_key)
+                if charge_increments is None:
+                    charge_increments = [
+                        charge_increment.value_in_unit(unit.elementary_charge)
+                        for charge_increment in parameter_type.charge_increment
+                    ]
+
+                    # If we've been provided with one less charge increment value than tagged atoms, assume the last
+                    # tagged atom offsets the charge of the others to make the chargeincrement net-neutral
+                    if len(atom_indices) - len(charge_increments) == 1:
+                        charge_increments.append(-sum(charge_increments))
+                    elif len(atom_indices) - len(charge_increments) == 0:
+                        pass
+                    else:
+                        raise SMIRNOFFSpecError(
+                            f"Trying to apply chargeincrements {parameter_type} "
+                            f"to tagged atoms {atom_indices}, but the number of chargeincrements "
+                            f"must be either the same as- or one less than the number of tagged atoms."
+                        )
+                    charge_increments_cache[cache_key] = charge_increments
 
-                # If we've been provided with one less charge increment value than tagged atoms, assume the last
-                # tagged atom offsets the charge of the others to make the chargeincrement net-neutral
-                if len(atom_indices) - len(charge_increments) == 1:
-                    charge_increment_sum = 0.0 * unit.elementary_charge
-                    for ci in charge_increments:
-                        charge_increment_sum += ci
-                    charge_increments.append(-charge_increment_sum)
-                elif len(atom_indices) - len(charge_increments) == 0:
-                    pass
-                else:
-                    raise SMIRNOFFSpecError(
-                        f"Trying to apply chargeincrements {charge_increment_match.parameter_type} "
-                        f"to tagged atoms {atom_indices}, but the number of chargeincrements "
-                        f"must be either the same as- or one less than the number of tagged atoms."
-                    )
+                increment_particle_idxs.extend(atom_indices)
+                increments.extend(charge_increments)
 
-                for top_particle_idx, charge_increment in zip(
-                    atom_indices, charge_increments
-                ):
-                    if top_particle_idx in charges_to_assign:
-                        charges_to_assign[top_particle_idx] += charge_increment
+            # Several matches may increment the same particle, so accumulate them
+            # with np.add.at.
+            np.add.at(
+                particle_charges,
+                np.array(increment_particle_idxs, dtype=np.int64),
+                np.array(increments, dtype=float),
+            )
 
             # Set the incremented charges on the System particles
-            for topology_particle_index, charge_to_assign in charges_to_assign.items():
-                _, sigma, epsilon = force.getParticleParameters(topology_particle_index)
-                force.setParticleParameters(
-                    topology_particle_index, charge_to_assign, sigma, epsilon
-                )
+            self._set_particle_charges(
+                force,
+                zip(
+                    top_particle_idxs.tolist(),
+                    particle_charges[top_particle_idxs].tolist(),
+                ),
+            )
 
             # Finally, mark that charges were assigned for this reference molecule
             self.mark_charges_assigned(ref_mol, topology)
@@ -4442,75 +5144,41 @@ class GBSAHandler(ParameterHandler):
     )
     solvent_radius = ParameterAttribute(default=1.4 * unit.angstrom, unit=unit.angstrom)
 
+    # The surface area parameters supported by the implementation of each GB model
+    # when a surface area model is used. HCT and OBC1 are implemented via GBSAHCTForce
+    # and GBSAOBC1Force (CustomAmberGBForceBase), which hard-code both values, and
+    # OBC2 via GBSAOBCForce, which hard-codes the solvent radius.
+    # Justification at https://github.com/openforcefield/openforcefield/pull/363
+    _SUPPORTED_SA_PARAMETERS = {
+        "HCT": {
+            "surface_area_penalty": 5.4 * unit.calorie / unit.mole / unit.angstrom ** 2,
+            "solvent_radius": 1.4 * unit.angstrom,
+        },
+        "OBC1": {
+            "surface_area_penalty": 5.4 * unit.calorie / unit.mole / unit.angstrom ** 2,
+            "solvent_radius": 1.4 * unit.angstrom,
+        },
+        "OBC2": {
+            "solvent_radius": 1.4 * unit.angstrom,
+        },
+    }
+
     def _validate_parameters(self):
         """
         Checks internal attributes, raising an exception if they are configured in an invalid way.
         """
-        # If we're using HCT via GBSAHCTForce(CustomAmberGBForceBase):, then we need to ensure that:
-        #   surface_area_energy is 5.4 cal/mol/A^2
-        #   solvent_radius is 1.4 A
-        # Justification at https://github.com/openforcefield/openforcefield/pull/363
-        if self.gb_model == "HCT":
-            if (
-                self.surface_area_penalty
-                != 5.4 * unit.calorie / unit.mole / unit.angstrom ** 2
-            ) and (self.sa_model is not None):
-                raise IncompatibleParameterError(
-                    f"The current implementation of HCT GBSA does not "
-                    f"support surface_area_penalty values other than 5.4 "
-                    f"cal/mol A^2 (data source specified value of "
-                    f"{self.surface_area_penalty})"
-                )
-
-            if (self.solvent_radius != 1.4 * unit.angstrom) and (
-                self.sa_model is not None
-            ):
-                raise IncompatibleParameterError(
-                    f"The current implementation of HCT GBSA does not "
-                    f"support solvent_radius values other than 1.4 "
-                    f"A (data source specified value of "
-                    f"{self.solvent_radius})"
-                )
-
-        # If we're using OBC1 via GBSAOBC1Force(CustomAmberGBForceBase), then we need to ensure that:
-        #   surface_area_energy is 5.4 cal/mol/A^2
-        #   solvent_radius is 1.4 A
-        # Justification at https://github.com/openforcefield/openforcefield/pull/363
-        if self.gb_model == "OBC1":
-            if (
-                self.surface_area_penalty
-                != 5.4 * unit.calorie / unit.mole / unit.angstrom ** 2
-            ) and (self.sa_model is not None):
-                raise IncompatibleParameterError(
-                    f"The current implementation of OBC1 GBSA does not "
-                    f"support surface_area_penalty values other than 5.4 "
-                    f"cal/mol A^2 (data source specified value of "
-                    f"{self.surface_area_penalty})"
-                )
-
-            if (self.solvent_radius != 1.4 * unit.angstrom) and (
-                self.sa_model is not None
-            ):
-                raise IncompatibleParameterError(
-                    f"The current implementation of OBC1 GBSA does not "
-                    f"support solvent_radius values other than 1.4 "
-                    f"A (data source specified value of "
-                    f"{self.solvent_radius})"
-                )
-
-        # If we're using OBC2 via GBSAOBCForce, then we need to ensure that
-        #   solvent_radius is 1.4 A
-        # Justification at https://github.com/openforcefield/openforcefield/pull/363
-        if self.gb_model == "OBC2":
+        if self.sa_model is None:
+            return
 
-            if (self.solvent_radius != 1.4 * unit.angstrom) and (
-                self.sa_model is not None
-            ):
+        for attr_name, supported_value in self._SUPPORTED_SA_PARAMETERS[
+            self.gb_model
+        ].items():
+            value = getattr(self, attr_name)
+            if value != supported_value:
                 raise IncompatibleParameterError(
-                    f"The current implementation of OBC1 GBSA does not "
-                    f"support solvent_radius values other than 1.4 "
-                    f"A (data source specified value of "
-                    f"{self.solvent_radius})"
+                    f"The current implementation of {self.gb_model} GBSA does not "
+                    f"support {attr_name} values other than {supported_value} "
+                    f"(data source specified value of {value})"
                 )
 
     # Tolerance when comparing float attributes for handler compatibility.
@@ -4547,11 +5215,8 @@ class GBSAHandler(ParameterHandler):
         self._validate_parameters()
 
         # Grab the existing nonbonded force (which will have particle charges)
-        existing = [system.getForce(i) for i in range(system.getNumForces())]
-        existing = [f for f in existing if type(f) == openmm.NonbondedForce]
-        assert len(existing) == 1
-
-        nonbonded_force = existing[0]
+        nonbonded_force = _get_force(system, openmm.NonbondedForce)
+        assert nonbonded_force is not None
 
         # No previous GBSAForce should exist, so we're safe just making one here.
         force_map = {
@@ -4632,29 +5297,47 @@ class GBSAHandler(ParameterHandler):
         # for topology_particle in topology.topology_particles:
         # gbsa_force.addParticle([0.0, 1.0, 0.0])
 
-        params_to_add = [[] for _ in topology.topology_particles]
+        # Read the charges of all the particles in one pass (in elementary charge units).
+        particle_charges = _get_particle_charges(nonbonded_force)
+
+        # The parameters are passed to OpenMM as plain floats in MD units (e, nm), and
+        # are collected in one array per parameter. The radius of each GBSA type is only
+        # stripped of its units once.
+        radius_by_gbsatype = dict()
+        particle_radii = np.zeros(topology.n_topology_particles)
+        particle_scales = np.zeros(topology.n_topology_particles)
         for atom_key, atom_match in atom_matches.items():
             atom_idx = atom_key[0]
             gbsatype = atom_match.parameter_type
-            charge, _, _2 = nonbonded_force.getParticleParameters(atom_idx)
-            params_to_add[atom_idx] = [charge, gbsatype.radius, gbsatype.scale]
-
+            radius = radius_by_gbsatype.get(id(gbsatype))
+            if radius is None:
+                radius = gbsatype.radius.value_in_unit(unit.nanometer)
+                radius_by_gbsatype[id(gbsatype)] = radius
+            particle_radii[atom_idx] = radius
+            particle_scales[atom_idx] = gbsatype.scale
+
+        params_to_add = zip(
+            particle_charges.tolist(), particle_radii.tolist(), particle_scales.tolist()
+        )
+        add_particle = gbsa_force.addParticle
         if self.gb_model == "OBC2":
-            for particle_param in params_to_add:
-                gbsa_force.addParticle(*particle_param)
+            for charge, radius, scale in params_to_add:
+                add_particle(charge, radius, scale)
         else:
-            for particle_param in params_to_add:
-                gbsa_force.addParticle(particle_param)
+            for charge, radius, scale in params_to_add:
+                add_particle([charge, radius, scale])
             # We have to call finalize() for models that inherit from CustomAmberGBForceBase,
             # otherwise the added particles aren't actually passed to the underlying CustomGBForce
             gbsa_force.finalize()
 
         # Check that no atoms (n.b. not particles) are missing force parameters.
         self._check_all_valence_terms_assigned(
-            assigned_terms=atom_matches, valence_terms=list(topology.topology_atoms)
+            assigned_terms=atom_matches,
+            valence_terms=topology.topology_atoms,
+            n_valence_terms=topology.n_topology_atoms,
         )
 
-        system.addForce(gbsa_force)
+        _add_force(system, gbsa_force)
 
 
 class VirtualSiteHandler(_NonbondedHandler):
@@ -60,7 +60,7 @@ import logging
 import subprocess
 import tempfile
 from distutils.spawn import find_executable
-from functools import wraps
+from functools import lru_cache, wraps
 
 import numpy as np
 from simtk import unit
@@ -2433,6 +2433,40 @@ class OpenEyeToolkitWrapper(ToolkitWrapper):
         unique_tags = tuple(sorted(list(unique_tags)))
         return tuple(unique_tags), tuple(connections)
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _get_smarts_query(smarts, aromaticity_model):
+        """Parse a SMARTS string into an OpenEye query for an aromaticity model.
+
+        The same SMIRKS are matched against every molecule parametrized with a force
+        field, so prepared queries are cached. ``OESubSearch`` copies the query it is
+        constructed from, so the cached query is never modified by matching.
+
+        Parameters
+        ----------
+        smarts : str
+            SMARTS string with any number of sequentially tagged atoms.
+        aromaticity_model : str
+            Name of an OpenEye aromaticity model, such as ``OEAroModel_MDL``.
+
+        Returns
+        -------
+        qmol : openeye.oechem.OEQMol
+            The query molecule.
+
+        """
+        from openeye import oechem
+
+        qmol = oechem.OEQMol()
+        if not oechem.OEParseSmarts(qmol, smarts):
+            raise ValueError(f"Error parsing SMARTS '{smarts}'")
+
+        oearomodel = getattr(oechem, aromaticity_model)
+        oechem.OEClearAromaticFlags(qmol)
+        oechem.OEAssignAromaticFlags(qmol, oearomodel)
+        oechem.OEAssignHybridization(qmol)
+        return qmol
+
     @staticmethod
     def _find_smarts_matches(
         oemol, smarts, aromaticity_model=DEFAULT_AROMATICITY_MODEL
@@ -2469,10 +2503,6 @@ class OpenEyeToolkitWrapper(ToolkitWrapper):
 
         # Make a copy of molecule so we don't influence original (probably safer than deepcopy per C Bayly)
         mol = oechem.OEMol(oemol)
-        # Set up query
-        qmol = oechem.OEQMol()
-        if not oechem.OEParseSmarts(qmol, smarts):
-            raise ValueError(f"Error parsing SMARTS '{smarts}'")
 
         # Apply aromaticity model
         if type(aromaticity_model) == str:
@@ -2490,12 +2520,10 @@ class OpenEyeToolkitWrapper(ToolkitWrapper):
         # Prepare molecule
         oechem.OEClearAromaticFlags(mol)
         oechem.OEAssignAromaticFlags(mol, oearomodel)
-
-        # If aromaticity model was provided, prepare query molecule
-        oechem.OEClearAromaticFlags(qmol)
-        oechem.OEAssignAromaticFlags(qmol, oearomodel)
         oechem.OEAssignHybridization(mol)
-        oechem.OEAssignHybridization(qmol)
+
+        # Set up query, prepared with the same aromaticity model
+        qmol = OpenEyeToolkitWrapper._get_smarts_query(smarts, aromaticity_model)
 
         # Build list of matches
         # TODO: The MoleculeImage mapping should preserve ordering of template molecule for equivalent atoms
@@ -3814,6 +3842,45 @@ class RDKitToolkitWrapper(ToolkitWrapper):
         unique_tags = tuple(sorted(list(unique_tags)))
         return unique_tags, connections
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _get_smarts_query(smirks):
+        """Parse a SMARTS string into an RDKit query molecule.
+
+        The same SMIRKS are matched against every molecule parametrized with a force
+        field, so parsed queries are cached. Substructure matching does not modify the
+        query, so it can safely be shared between calls.
+
+        Parameters
+        ----------
+        smirks : str
+            SMARTS string with any number of sequentially tagged atoms.
+
+        Returns
+        -------
+        qmol : rdkit.Chem.Mol
+            The query molecule.
+        map_list : tuple of int
+            ``map_list[i]`` is the index in ``qmol`` of the atom tagged ``i+1``.
+
+        """
+        from rdkit import Chem
+
+        qmol = Chem.MolFromSmarts(smirks)  # cannot catch the error
+        if qmol is None:
+            raise ValueError(
+                'RDKit could not parse the SMIRKS string "{}"'.format(smirks)
+            )
+
+        # Create atom mapping for query molecule
+        idx_map = dict()
+        for atom in qmol.GetAtoms():
+            smirks_index = atom.GetAtomMapNum()
+            if smirks_index != 0:
+                idx_map[smirks_index - 1] = atom.GetIdx()
+        map_list = tuple(idx_map[x] for x in sorted(idx_map))
+        return qmol, map_list
+
     @staticmethod
     def _find_smarts_matches(rdmol, smirks, aromaticity_model="OEAroModel_MDL"):
         """Find all sets of atoms in the provided RDKit molecule that match the provided SMARTS string.
@@ -3855,19 +3922,7 @@ class RDKitToolkitWrapper(ToolkitWrapper):
             raise ValueError("Unknown aromaticity model: {}".aromaticity_models)
 
         # Set up query.
-        qmol = Chem.MolFromSmarts(smirks)  # cannot catch the error
-        if qmol is None:
-            raise ValueError(
-                'RDKit could not parse the SMIRKS string "{}"'.format(smirks)
-            )
-
-        # Create atom mapping for query molecule
-        idx_map = dict()
-        for atom in qmol.GetAtoms():
-            smirks_index = atom.GetAtomMapNum()
-            if smirks_index != 0:
-                idx_map[smirks_index - 1] = atom.GetIdx()
-        map_list = [idx_map[x] for x in sorted(idx_map)]
+        qmol, map_list = RDKitToolkitWrapper._get_smarts_query(smirks)
 
         # Perform matching
         matches = list()